@@ -5,26 +5,561 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba_array
+from matplotlib.patches import Patch
 import time
 import os
+import sys
+import secrets
+import pickle
+import io
+import hashlib
+import warnings
+import math
+import traceback
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 from scipy import stats
 
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+    def njit(*args, **kwargs):
+        """Sustituto de numba.njit cuando Numba no está instalado."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# Numba guarda la compilación en caché junto al código fuente; un ejecutable
+# empaquetado solo trae .pyc y ahí cache=True falla ya al decorar la función
+CACHE_JIT = (not getattr(sys, 'frozen', False) and __file__.endswith('.py')
+             and os.path.exists(__file__))
+
 # Aumentar el límite de tamaño de imagen para evitar el error de decompression bomb
 Image.MAX_IMAGE_PIXELS = None
 
+# Carpeta de las imágenes: junto a este archivo, o la carpeta temporal de
+# PyInstaller cuando la aplicación está empaquetada
+RUTA_RECURSOS = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+def ruta_recurso(nombre):
+    """Devuelve la ruta de un archivo de recursos de la aplicación."""
+    return os.path.join(RUTA_RECURSOS, nombre)
+
+# Carpeta de caché por usuario; la de recursos puede ser temporal (PyInstaller)
+# o no tener permiso de escritura en una instalación
+RUTA_CACHE = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+    or os.path.join(os.path.expanduser('~'), '.cache'),
+    'SimuStats')
+
+# Parámetros del LCG (Numerical Recipes)
+LCG_A = 1664525
+LCG_C = 1013904223
+LCG_M = 2**32
+
+# Cantidad de valores que se generan por bloque vectorizado
+BLOQUE_LCG = 65536
+
+# Flujos xorshift128+ que avanzan en paralelo (uno por elemento de los arreglos de estado)
+CARRILES = 4096
+
+# Pasos que se descartan tras sembrar los carriles
+PASOS_CALENTAMIENTO = 20
+
+# Pasos de todos los carriles que se calculan juntos al descartar valores
+PASOS_POR_BLOQUE = BLOQUE_LCG // CARRILES
+
+# Desplazamientos de xorshift128+ (Vigna) y conversión a 53 bits de mantisa
+_XS_A = np.uint64(23)
+_XS_B = np.uint64(17)
+_XS_C = np.uint64(26)
+_XS_MANTISA = np.uint64(11)
+_U32 = np.uint64(32)
+
+# Ensayos a partir de los cuales la binomial usa la CDF en lugar de sumar Bernoullis
+BINOMIAL_MAX_ENSAYOS = 50
+
+_MASCARA_32 = np.uint64(LCG_M - 1)
+
+# Bits que se descartan para obtener uniformes float32 (24 bits de mantisa)
+_XS_MANTISA_32 = np.uint64(40)
+
+# Tipos de punto flotante disponibles para los uniformes de comparación
+PRECISIONES = {'float64': np.float64, 'float32': np.float32}
+
+def _tablas_salto_lcg(k):
+    """
+    Precalcula los coeficientes de salto del LCG.
+
+    Para t = 1..k se cumple x_{n+t} = (A_t * x_n + C_t) mod m, con
+    A_t = a^t mod m y C_t = c * (a^(t-1) + ... + a + 1) mod m.
+    Las tablas se construyen por duplicación: A_{h+t} = A_t * A_h y
+    C_{h+t} = A_t * C_h + C_t.
+
+    Returns
+    -------
+    tuple : (A, C) como arreglos np.uint64 de longitud k
+    """
+    A = np.array([LCG_A], dtype=np.uint64)
+    C = np.array([LCG_C], dtype=np.uint64)
+    while A.size < k:
+        A_h, C_h = A[-1], C[-1]
+        A, C = (np.concatenate((A, (A * A_h) & _MASCARA_32)),
+                np.concatenate((C, (A * C_h + C) & _MASCARA_32)))
+    return A[:k], C[:k]
+
+_SALTO_A, _SALTO_C = _tablas_salto_lcg(BLOQUE_LCG)
+
+def _lcg_secuencia(x, n):
+    """
+    Devuelve los n estados del LCG que siguen a x.
+
+    Cada bloque se calcula con una sola operación de NumPy usando las
+    tablas de salto, a partir del último estado del bloque anterior.
+
+    Returns
+    -------
+    np.ndarray : Los n estados enteros generados (np.uint64)
+    """
+    estados = np.empty(n, dtype=np.uint64)
+    x = np.uint64(x)
+    for inicio in range(0, n, BLOQUE_LCG):
+        k = min(BLOQUE_LCG, n - inicio)
+        bloque = (_SALTO_A[:k] * x + _SALTO_C[:k]) & _MASCARA_32
+        estados[inicio:inicio + k] = bloque
+        x = bloque[-1]
+    return estados
+
+# Constantes del método Ziggurat (Marsaglia y Tsang, 256 capas)
+ZIG_CAPAS = 256
+ZIG_R = 3.6541528853610088
+ZIG_V = 0.00492867323399
+
+def _tablas_ziggurat():
+    """
+    Construye las tablas del Ziggurat para la semi-normal f(x) = exp(-x²/2).
+
+    x[i] es el ancho de la capa i (x[0] es el ancho virtual de la base,
+    x[1] = r) y y[i] = f(x[i]); todas las capas tienen área ZIG_V.
+
+    Returns
+    -------
+    tuple : (x, y) como arreglos float64 de longitud ZIG_CAPAS + 1
+    """
+    x = np.empty(ZIG_CAPAS + 1)
+    f_r = np.exp(-0.5 * ZIG_R * ZIG_R)
+    x[0] = ZIG_V / f_r
+    x[1] = ZIG_R
+    for i in range(1, ZIG_CAPAS - 1):
+        x[i + 1] = np.sqrt(-2.0 * np.log(ZIG_V / x[i] + np.exp(-0.5 * x[i] * x[i])))
+    x[ZIG_CAPAS] = 0.0
+    return x, np.exp(-0.5 * x * x)
+
+_ZIG_X, _ZIG_Y = _tablas_ziggurat()
+
+# A partir de este λ la Poisson usa PTRS en lugar de la CDF tabulada
+POISSON_LAMBDA_PTRS = 30
+
+# Tamaño a partir del cual se usan los kernels compilados con Numba
+UMBRAL_JIT = 1024
+
+@njit(cache=CACHE_JIT, fastmath=True)
+def _ziggurat_kernel(u, salida, x, y):
+    """
+    Llena `salida` con normales estándar por el método Ziggurat,
+    consumiendo en orden los uniformes de `u`.
+
+    Returns
+    -------
+    int : Cantidad de valores generados (menor que salida.size si
+          se agotaron los uniformes)
+    """
+    n = salida.size
+    m = u.size
+    i = 0
+    j = 0
+    while i < n and j + 2 <= m:
+        capa = int(u[j] * ZIG_CAPAS)
+        candidato = (2.0 * u[j + 1] - 1.0) * x[capa]
+        j += 2
+        if abs(candidato) < x[capa + 1]:
+            salida[i] = candidato
+            i += 1
+        elif capa == 0:
+            # Cola más allá de r (método de Marsaglia)
+            while j + 2 <= m:
+                a = -math.log(1.0 - u[j]) / ZIG_R
+                b = -math.log(1.0 - u[j + 1])
+                j += 2
+                if 2.0 * b > a * a:
+                    salida[i] = math.copysign(ZIG_R + a, candidato)
+                    i += 1
+                    break
+        elif j < m:
+            altura = y[capa] + u[j] * (y[capa + 1] - y[capa])
+            j += 1
+            if altura < math.exp(-0.5 * candidato * candidato):
+                salida[i] = candidato
+                i += 1
+    return i
+
+@njit(cache=CACHE_JIT, fastmath=True)
+def _poisson_ptrs_kernel(u, salida, lambd):
+    """
+    Llena `salida` con valores Poisson(λ) por el método PTRS,
+    consumiendo en orden los uniformes de `u` (dos por intento).
+
+    Returns
+    -------
+    int : Cantidad de valores generados
+    """
+    slam = math.sqrt(lambd)
+    loglam = math.log(lambd)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    log_invalpha = math.log(1.1239 + 1.1328 / (b - 3.4))
+    vr = 0.9277 - 3.6224 / (b - 2)
+    n = salida.size
+    i = 0
+    j = 0
+    while i < n and j + 2 <= u.size:
+        U = u[j] - 0.5
+        V = u[j + 1]
+        j += 2
+        us = 0.5 - abs(U)
+        if us == 0.0:
+            continue
+        k = math.floor((2 * a / us + b) * U + lambd + 0.43)
+        if us >= 0.07 and V <= vr:
+            salida[i] = k
+            i += 1
+            continue
+        if k < 0 or (us < 0.013 and V > us) or V == 0.0:
+            continue
+        if (math.log(V) + log_invalpha - math.log(a / (us * us) + b)
+                <= -lambd + k * loglam - math.lgamma(k + 1)):
+            salida[i] = k
+            i += 1
+    return i
+
+@njit(cache=CACHE_JIT)
+def _binomial_kernel(u, p, n_trials, salida):
+    """
+    Llena `salida` contando, para cada valor, cuántos de sus n_trials
+    uniformes consecutivos en `u` son menores que p.
+    """
+    for i in range(salida.size):
+        exitos = 0
+        base = i * n_trials
+        for j in range(n_trials):
+            if u[base + j] < p:
+                exitos += 1
+        salida[i] = exitos
+
+@njit(cache=CACHE_JIT)
+def _poisson_inversa_kernel(u, cdf, salida):
+    """
+    Transformación inversa por búsqueda secuencial desde k = 0.
+
+    Para λ < POISSON_LAMBDA_PTRS el número esperado de comparaciones
+    es λ + 1, menor que el de una búsqueda binaria sobre la tabla.
+    """
+    ultimo = cdf.size - 1
+    for i in range(u.size):
+        k = 0
+        while k < ultimo and u[i] >= cdf[k]:
+            k += 1
+        salida[i] = k
+
+@njit(cache=CACHE_JIT)
+def _momentos_kernel(datos):
+    """
+    Media, varianza poblacional, mínimo y máximo en una sola pasada.
+
+    Las sumas se acumulan sobre los datos desplazados por el primer
+    valor (varianza con corrimiento), lo que evita la cancelación de
+    la fórmula E[x²] - E[x]² sin la división por elemento de Welford.
+
+    Returns
+    -------
+    tuple : (media, varianza, minimo, maximo)
+    """
+    corrimiento = float(datos[0])
+    suma = 0.0
+    suma_cuad = 0.0
+    minimo = corrimiento
+    maximo = corrimiento
+    for i in range(datos.size):
+        x = float(datos[i])
+        d = x - corrimiento
+        suma += d
+        suma_cuad += d * d
+        minimo = min(minimo, x)
+        maximo = max(maximo, x)
+    n = datos.size
+    media_d = suma / n
+    return corrimiento + media_d, max(suma_cuad / n - media_d * media_d, 0.0), minimo, maximo
+
+def estadisticas_basicas(datos):
+    """
+    Calcula media, desviación estándar, varianza, mínimo y máximo.
+
+    Con Numba se recorren los datos una sola vez; sin Numba se usan
+    las reducciones de NumPy, derivando la desviación de la varianza.
+    Si hay valores no finitos (nan, inf) también se usa NumPy, para que
+    el resultado no dependa de tener Numba instalado.
+
+    Returns
+    -------
+    tuple : (media, desv_std, varianza, minimo, maximo)
+    """
+    if NUMBA_DISPONIBLE:
+        media, varianza, minimo, maximo = _momentos_kernel(datos)
+    if not NUMBA_DISPONIBLE or not (math.isfinite(media) and math.isfinite(varianza)):
+        media = np.mean(datos)
+        varianza = np.var(datos)
+        minimo = np.min(datos)
+        maximo = np.max(datos)
+    return media, math.sqrt(varianza), varianza, minimo, maximo
+
+# Colores RGBA de los puntos fuera (0) y dentro (1) del círculo en la estimación de π
+COLORES_PI = to_rgba_array(['#e74c3c', '#27ae60'])
+
+# Puntos que se dibujan en el gráfico de π; la estimación usa todos, pero
+# rasterizar millones de puntos con color propio tarda varios segundos
+PI_PUNTOS_GRAFICO = 20000
+
+# Tope de rondas por jugador en la simulación de la ruina del jugador
+RUINA_MAX_RONDAS = 10000
+
+# Jugadores cuya evolución completa se guarda para graficarla
+RUINA_TRAYECTORIAS = 5
+
+# Clases de los histogramas de las simulaciones Monte Carlo
+CLASES_MONTE_CARLO = 40
+
+# Normales por bloque en la prueba de hipótesis (8 MB en float64); las
+# muestras se generan y promedian por bloques de filas de este tamaño
+HIPOTESIS_BLOQUE = 1 << 20
+
+@njit(cache=CACHE_JIT)
+def _ruina_kernel(u, capital, apuesta, prob, estado, finales, rondas, trayectorias):
+    """
+    Continúa la simulación de la ruina del jugador con los uniformes de `u`.
+
+    `estado` guarda (jugador, capital, ronda) entre llamadas: al agotarse
+    `u` se retoma en el mismo punto con un nuevo bloque, de modo que el
+    flujo se consume igual que llamando a lcg() ronda por ronda. Las
+    primeras trayectorias.shape[0] simulaciones se registran completas.
+
+    Returns
+    -------
+    bool : True si se completaron todas las simulaciones
+    """
+    i, cap, r = int(estado[0]), int(estado[1]), int(estado[2])
+    n_u = len(u)
+    j = 0
+    while i < finales.size:
+        while cap > 0 and r < RUINA_MAX_RONDAS:
+            if j == n_u:
+                estado[0], estado[1], estado[2] = i, cap, r
+                return False
+            if u[j] < prob:
+                cap += apuesta
+            else:
+                cap -= apuesta
+            j += 1
+            r += 1
+            if i < trayectorias.shape[0]:
+                trayectorias[i, r] = cap
+        finales[i] = cap
+        rondas[i] = r
+        i += 1
+        cap = capital
+        r = 0
+    estado[0] = i
+    return True
+
+def _ruina_vectorizada(u, capital, apuesta, prob, estado, finales, rondas, trayectorias):
+    """
+    Versión NumPy de _ruina_kernel para cuando Numba no está disponible.
+
+    Cada jugador avanza por tramos de rondas: los pasos de un tramo se
+    acumulan con cumsum y la primera ronda con capital <= 0 se ubica con
+    argmax. Los tramos empiezan cortos y se duplican, de modo que un
+    jugador que se arruina pronto no recorre miles de uniformes. Consume
+    `u` y actualiza `estado` exactamente igual que el kernel compilado.
+
+    Returns
+    -------
+    bool : True si se completaron todas las simulaciones
+    """
+    i, cap, r = int(estado[0]), int(estado[1]), int(estado[2])
+    n_u = u.size
+    j = 0
+    while i < finales.size:
+        tramo = 64
+        while cap > 0 and r < RUINA_MAX_RONDAS:
+            m = min(tramo, RUINA_MAX_RONDAS - r, n_u - j)
+            if m == 0:
+                estado[0], estado[1], estado[2] = i, cap, r
+                return False
+            caminos = np.where(u[j:j + m] < prob, apuesta, -apuesta).cumsum()
+            caminos += cap
+            quiebra = caminos <= 0
+            k = int(quiebra.argmax()) + 1 if quiebra.any() else m
+            if i < trayectorias.shape[0]:
+                trayectorias[i, r + 1:r + k + 1] = caminos[:k]
+            cap = int(caminos[k - 1])
+            j += k
+            r += k
+            tramo *= 2
+        finales[i] = cap
+        rondas[i] = r
+        i += 1
+        cap = capital
+        r = 0
+    estado[0] = i
+    return True
+
+# Filas que se formatean juntas al exportar datos
+FILAS_POR_ESCRITURA = 65536
+
+# Tamaño del buffer del archivo de exportación (1 MiB)
+BUFFER_EXPORTACION = 1 << 20
+
+# Resolución de los gráficos exportados como PNG
+DPI_GRAFICO = 150
+
+# Mayor valor discreto para el que las frecuencias se cuentan con np.bincount
+MAX_VALOR_BINCOUNT = 10000
+
+def escribir_filas(f, datos, formato):
+    """
+    Escribe una fila por valor en el archivo f.
+
+    `formato` es una plantilla de estilo % que recibe el índice (desde 1)
+    y el valor, por ejemplo "%d,%.6f\n". Cada bloque de filas se arma con
+    una sola operación de formato y se escribe de una vez.
+    """
+    # La plantilla de un bloque completo se arma una sola vez; solo el
+    # último bloque, más corto, necesita la suya
+    plantilla = formato * FILAS_POR_ESCRITURA
+    for inicio in range(0, len(datos), FILAS_POR_ESCRITURA):
+        bloque = datos[inicio:inicio + FILAS_POR_ESCRITURA].tolist()
+        campos = [None] * (2 * len(bloque))
+        campos[0::2] = range(inicio + 1, inicio + len(bloque) + 1)
+        campos[1::2] = bloque
+        if len(bloque) < FILAS_POR_ESCRITURA:
+            plantilla = formato * len(bloque)
+        f.write(plantilla % tuple(campos))
+
+def _limpiar_datos_ejes(ax, conservar=None):
+    """
+    Quita de `ax` los artistas de datos (colecciones, líneas, parches,
+    textos y leyenda) sin tocar ticks, rejilla, fondo ni etiquetas.
+
+    A diferencia de ``ax.clear()`` no reconstruye los ejes; solo devuelve
+    el aspecto y el autoescalado a su estado por defecto para que el
+    siguiente gráfico calcule sus propios límites. Si se entrega el
+    contenedor `conservar` (por ejemplo las barras de un histograma que
+    se van a actualizar), él y sus artistas se dejan en los ejes.
+    """
+    mantener = set(conservar) if conservar is not None else set()
+    for contenedor in list(ax.containers):
+        if contenedor is not conservar:
+            contenedor.remove()
+    for artista in (*ax.collections, *ax.lines, *ax.patches, *ax.texts):
+        if artista not in mantener:
+            artista.remove()
+    leyenda = ax.get_legend()
+    if leyenda is not None:
+        leyenda.remove()
+    ax.set_aspect('auto')
+    ax.set_autoscale_on(True)
+    ax.relim()
+
+# Funciones de la integral Monte Carlo que se conservan compiladas
+EXPRESIONES_EN_CACHE = 32
+
+@lru_cache(maxsize=EXPRESIONES_EN_CACHE)
+def _compilar_integrando(texto):
+    """
+    Compila la expresión y = f(x) escrita por el usuario.
+
+    El código se genera una sola vez por texto; repetir la simulación con
+    la misma función lo reutiliza. La expresión se evalúa luego con `x`
+    como arreglo, de modo que cada evaluación es una operación vectorizada.
+    """
+    return compile(texto, '<función>', 'eval')
+
+# Tablas de CDF que se conservan entre generaciones
+TABLAS_EN_CACHE = 16
+
+@lru_cache(maxsize=TABLAS_EN_CACHE)
+def _poisson_cdf(lambd):
+    """
+    Tabula la CDF de Poisson(λ) hasta k ≈ λ + 10√λ + 10, donde la cola
+    restante es menor que 1e-12.
+
+    Las probabilidades se obtienen con la recurrencia p(k) = p(k-1)·λ/k,
+    y la tabla se guarda en caché para reutilizarla con el mismo λ.
+
+    Returns
+    -------
+    np.ndarray : Valores acumulados P(X <= k) para k = 0..k_max
+    """
+    k_max = int(lambd + 10 * math.sqrt(lambd) + 10)
+    cocientes = lambd / np.arange(1, k_max + 1)
+    pmf = math.exp(-lambd) * np.concatenate(([1.0], np.cumprod(cocientes)))
+    cdf = np.cumsum(pmf)
+    cdf.flags.writeable = False
+    return cdf
+
+@lru_cache(maxsize=TABLAS_EN_CACHE)
+def _binomial_cdf(n_trials, p):
+    """
+    Tabula la CDF de B(n_trials, p) para k = 0..n_trials.
+
+    Se guarda en caché para que las generaciones repetidas con los
+    mismos parámetros no vuelvan a evaluar scipy.
+
+    Returns
+    -------
+    np.ndarray : Valores acumulados P(X <= k)
+    """
+    cdf = stats.binom.cdf(np.arange(n_trials + 1), n_trials, p)
+    cdf.flags.writeable = False
+    return cdf
+
+@lru_cache(maxsize=TABLAS_EN_CACHE)
+def _z_critico(alpha):
+    """
+    Valor crítico bilateral z_{α/2} de la normal estándar.
+
+    Se guarda en caché para que las pruebas de hipótesis repetidas con el
+    mismo nivel de significancia no vuelvan a evaluar scipy.
+    """
+    return float(stats.norm.isf(alpha / 2))
+
 class GeneradorAleatorios:
     """
     Generador de variables aleatorias sin usar funciones random del lenguaje.
     
-    Utiliza el método de Generador Congruencial Lineal (LCG) como base
-    para generar números pseudoaleatorios uniformes en [0,1), y luego
-    aplica métodos de transformación para generar otras distribuciones.
+    Utiliza un Generador Congruencial Lineal (LCG) para sembrar CARRILES
+    flujos paralelos de xorshift128+, que generan por bloques vectorizados
+    números pseudoaleatorios uniformes en [0,1), y luego aplica métodos
+    de transformación para generar otras distribuciones.
     
     Parámetros
     ----------
     semilla : int, opcional
         Semilla inicial para el generador. Si no se proporciona,
-        se genera automáticamente usando el tiempo del sistema y otros factores.
+        se toma del generador criptográfico del sistema (secrets).
     
     Métodos
     -------
@@ -37,36 +572,171 @@ class GeneradorAleatorios:
     """
     
     def __init__(self, semilla=None):
-        if semilla is None:
-            # Combinar múltiples fuentes para mejor aleatoriedad
-            tiempo = int(time.time() * 1000000)
-            pid = os.getpid()
-            # Usar bytes del sistema si está disponible
-            try:
-                random_bytes = int.from_bytes(os.urandom(4), byteorder='big')
-                self.semilla = (tiempo ^ pid ^ random_bytes) % (2**31 - 1)
-            except:
-                self.semilla = (tiempo ^ pid) % (2**31 - 1)
-        else:
-            self.semilla = semilla
-        self.actual = self.semilla
+        # Precisión de los uniformes que solo se comparan contra un umbral
+        self.precision = 'float64'
+        self.resembrar(semilla)
+    
+    def resembrar(self, semilla=None):
+        """
+        Reinicia el generador con una nueva semilla.
+        
+        Parámetros
+        ----------
+        semilla : int, opcional
+            Si no se proporciona, se toma del generador del sistema (secrets).
+        """
+        self.semilla = secrets.randbits(31) if semilla is None else semilla
+        self._sembrar()
+    
+    def _sembrar(self):
+        """
+        Inicializa el estado (s0, s1) de cada carril con la secuencia del
+        LCG a partir de la semilla y descarta los primeros pasos.
+        """
+        # Estado en forma de estructura de arreglos: un arreglo contiguo por
+        # componente, de modo que cada paso recorre la memoria en orden
+        self.s0 = np.empty(CARRILES, dtype=np.uint64)
+        self.s1 = np.empty(CARRILES, dtype=np.uint64)
+        self._tmp = np.empty(CARRILES, dtype=np.uint64)
+        palabras = _lcg_secuencia(self.semilla % LCG_M, 4 * CARRILES).reshape(4, CARRILES)
+        np.bitwise_or(palabras[0] << _U32, palabras[1], out=self.s0)
+        np.bitwise_or(palabras[2] << _U32, palabras[3], out=self.s1)
+        self._generar(PASOS_CALENTAMIENTO)
+        # Buffer de salidas de 64 bits ya generadas y posición de la siguiente
+        self._buf = np.empty(0, dtype=np.uint64)
+        self._pos = 0
+        # Cantidad de uniformes entregados desde la siembra
+        self.posicion = 0
+    
+    def saltar_adelante(self, k):
+        """
+        Descarta los siguientes k uniformes del flujo.
+        
+        Junto con resembrar() permite reproducir una generación que no
+        empezó justo después de la siembra: resembrar(semilla) y luego
+        saltar_adelante(posicion).
+        
+        Parámetros
+        ----------
+        k : int, cantidad de valores a descartar
+        """
+        restantes = min(k, self._buf.size - self._pos)
+        self._pos += restantes
+        pasos, resto = divmod(k - restantes, CARRILES)
+        for inicio in range(0, pasos, PASOS_POR_BLOQUE):
+            self._generar(min(PASOS_POR_BLOQUE, pasos - inicio))
+        if resto:
+            self._buf = self._generar(1)
+            self._pos = resto
+        self.posicion += k
     
     def lcg(self):
         """
-        Generador Congruencial Lineal (LCG)
+        Devuelve un único número pseudoaleatorio uniforme.
         
-        Utiliza los parámetros de Numerical Recipes:
-        a = 1664525, c = 1013904223, m = 2^32
+        Se conserva por compatibilidad: entrega uno a uno los valores
+        del buffer interno, que se rellena con un paso de todos los
+        carriles xorshift128+.
         
         Returns
         -------
         float : Número pseudoaleatorio en el intervalo [0,1)
         """
-        a = 1664525
-        c = 1013904223
-        m = 2**32
-        self.actual = (a * self.actual + c) % m
-        return self.actual / m
+        if self._pos >= self._buf.size:
+            self._buf = self._generar(1)
+            self._pos = 0
+        valor = self._buf[self._pos]
+        self._pos += 1
+        self.posicion += 1
+        return float(valor >> _XS_MANTISA) * (1.0 / 2**53)
+    
+    def _generar(self, pasos):
+        """
+        Avanza todos los carriles xorshift128+ la cantidad de pasos indicada.
+        
+        Cada paso es s1 ^= s1 << 23; s1' = s1 ^ s0 ^ (s1 >> 17) ^ (s0 >> 26),
+        aplicado a los arreglos de estado completos, y produce s0 + s1'.
+        
+        Returns
+        -------
+        np.ndarray : Arreglo np.uint64 con pasos * CARRILES salidas de 64 bits
+        """
+        salida = np.empty((pasos, CARRILES), dtype=np.uint64)
+        x, y, t = self.s0, self.s1, self._tmp
+        for i in range(pasos):
+            # Todas las operaciones escriben sobre arreglos ya reservados;
+            # el nuevo s1 se arma en el lugar del s0 anterior
+            np.left_shift(x, _XS_A, out=t)
+            np.bitwise_xor(t, x, out=t)
+            np.right_shift(t, _XS_B, out=x)
+            np.bitwise_xor(x, t, out=x)
+            np.bitwise_xor(x, y, out=x)
+            np.right_shift(y, _XS_C, out=t)
+            np.bitwise_xor(x, t, out=x)
+            x, y = y, x
+            np.add(x, y, out=salida[i])
+        self.s0, self.s1 = x, y
+        return salida.ravel()
+    
+    @staticmethod
+    def _a_uniformes(bits, dtype=np.float64):
+        """
+        Convierte salidas de 64 bits en uniformes en [0,1).
+        
+        En float64 se usan los 53 bits altos; en float32, los 24 bits
+        altos, de modo que el resultado es exacto y nunca llega a 1.
+        """
+        if dtype == np.float32:
+            return (bits >> _XS_MANTISA_32).astype(np.float32) * np.float32(1.0 / 2**24)
+        return (bits >> _XS_MANTISA) * (1.0 / 2**53)
+    
+    def _xs128p_batch(self, n, dtype=np.float64):
+        """
+        Genera n uniformes en [0,1) de una sola vez.
+        
+        Primero consume lo que quede en el buffer de lcg(), por lo que
+        la secuencia es la misma que llamar n veces a lcg(); los valores
+        sobrantes del último paso quedan en el buffer.
+        
+        Parámetros
+        ----------
+        n : int, cantidad de valores a generar
+        dtype : np.float64 o np.float32 (default np.float64)
+        
+        Returns
+        -------
+        np.ndarray : Arreglo con n valores uniformes en [0,1)
+        """
+        self.posicion += n
+        restantes = min(n, self._buf.size - self._pos)
+        previos = self._buf[self._pos:self._pos + restantes]
+        self._pos += restantes
+        faltan = n - restantes
+        if faltan == 0:
+            return self._a_uniformes(previos, dtype)
+        nuevos = self._generar(-(-faltan // CARRILES))
+        self._buf = nuevos[faltan:]
+        self._pos = 0
+        return self._a_uniformes(np.concatenate((previos, nuevos[:faltan])), dtype)
+    
+    def _ejecutar_kernel(self, kernel, salida, uniformes_por_valor, *args):
+        """
+        Llena `salida` con un kernel compilado de rechazo.
+        
+        Se le entregan bloques de uniformes con un margen según el consumo
+        esperado por valor; si se agotan antes de completar, se repite
+        con un nuevo bloque para los valores que faltan.
+        
+        Returns
+        -------
+        np.ndarray : El mismo arreglo `salida`, completo
+        """
+        hechos = 0
+        while hechos < salida.size:
+            faltan = salida.size - hechos
+            u = self._xs128p_batch(int(uniformes_por_valor * faltan) + 64)
+            hechos += kernel(u, salida[hechos:], *args)
+        return salida
     
     def uniforme(self, a=0, b=1, n=1):
         """
@@ -80,9 +750,9 @@ class GeneradorAleatorios:
         
         Returns
         -------
-        list : Lista con n valores uniformes en [a,b)
+        np.ndarray : Arreglo con n valores uniformes en [a,b)
         """
-        return [a + (b - a) * self.lcg() for _ in range(n)]
+        return a + (b - a) * self._xs128p_batch(n)
     
     def exponencial(self, lambd=1.0, n=1):
         """
@@ -97,34 +767,86 @@ class GeneradorAleatorios:
         
         Returns
         -------
-        list : Lista con n valores exponenciales
+        np.ndarray : Arreglo con n valores exponenciales
         """
-        return [-np.log(self.lcg()) / lambd for _ in range(n)]
+        return -np.log(self._xs128p_batch(n)) / lambd
     
-    def normal(self, mu=0, sigma=1, n=1):
+    def normal(self, mu=0, sigma=1, n=1, out=None):
         """
         Distribución normal N(μ, σ²)
         
-        Utiliza el método de Box-Muller para transformar
-        variables uniformes en normales.
+        Utiliza el método Ziggurat de Marsaglia y Tsang: se elige una
+        de las 256 capas y un candidato dentro de ella; la gran mayoría
+        se acepta con una sola comparación, sin funciones trascendentes.
         
         Parámetros
         ----------
         mu : float, media (default 0)
         sigma : float, desviación estándar (default 1)
         n : int, cantidad de valores a generar (default 1)
+        out : np.ndarray, arreglo float64 contiguo de n elementos donde
+              escribir los valores en lugar de reservar uno nuevo (opcional)
         
         Returns
         -------
-        list : Lista con n valores normales
+        np.ndarray : Arreglo con n valores normales (`out` si se entregó)
         """
-        resultados = []
-        for _ in range(n):
-            u1 = self.lcg()
-            u2 = self.lcg()
-            z0 = np.sqrt(-2 * np.log(u1)) * np.cos(2 * np.pi * u2)
-            resultados.append(mu + sigma * z0)
-        return resultados
+        salida = np.empty(n) if out is None else out
+        z = salida.reshape(-1)
+        if NUMBA_DISPONIBLE and n > UMBRAL_JIT:
+            self._ejecutar_kernel(_ziggurat_kernel, z, 2.1, _ZIG_X, _ZIG_Y)
+            z *= sigma
+            z += mu
+            return salida
+        
+        pendientes = np.arange(n)
+        while pendientes.size:
+            m = pendientes.size
+            capa = (self._xs128p_batch(m) * ZIG_CAPAS).astype(np.intp)
+            candidato = (2.0 * self._xs128p_batch(m) - 1.0) * _ZIG_X[capa]
+            acepta = np.abs(candidato) < _ZIG_X[capa + 1]
+            
+            # Cuña: comparar contra la densidad dentro de la capa
+            cuña = ~acepta & (capa > 0)
+            if np.any(cuña):
+                c = capa[cuña]
+                y = _ZIG_Y[c] + self._xs128p_batch(c.size) * (_ZIG_Y[c + 1] - _ZIG_Y[c])
+                acepta[cuña] = y < np.exp(-0.5 * candidato[cuña] ** 2)
+            
+            # Base: valores más allá de r se toman de la cola
+            cola = ~acepta & (capa == 0)
+            if np.any(cola):
+                candidato[cola] = np.copysign(self._cola_normal(int(np.count_nonzero(cola))),
+                                              candidato[cola])
+                acepta[cola] = True
+            
+            z[pendientes[acepta]] = candidato[acepta]
+            pendientes = pendientes[~acepta]
+        z *= sigma
+        z += mu
+        return salida
+    
+    def _cola_normal(self, n):
+        """
+        Genera n valores de la cola normal |z| > r (método de Marsaglia).
+        
+        Se repite a = -ln(u1)/r, b = -ln(u2) hasta que 2b > a² y se
+        devuelve r + a.
+        
+        Returns
+        -------
+        np.ndarray : Arreglo float64 con n valores mayores que ZIG_R
+        """
+        cola = np.empty(n)
+        pendientes = np.arange(n)
+        while pendientes.size:
+            m = pendientes.size
+            a = -np.log(1.0 - self._xs128p_batch(m)) / ZIG_R
+            b = -np.log(1.0 - self._xs128p_batch(m))
+            acepta = 2.0 * b > a * a
+            cola[pendientes[acepta]] = ZIG_R + a[acepta]
+            pendientes = pendientes[~acepta]
+        return cola
     
     def bernoulli(self, p=0.5, n=1):
         """
@@ -137,15 +859,32 @@ class GeneradorAleatorios:
         
         Returns
         -------
-        list : Lista con n valores {0,1}
+        np.ndarray : Arreglo con n valores {0,1}
+        """
+        return self._bernoulli_batch(p, n)
+    
+    def _bernoulli_batch(self, p, n):
+        """
+        Genera n ensayos de Bernoulli comparando un bloque de uniformes con p.
+        
+        Los uniformes se generan con la precisión de self.precision; con
+        'float32' se mueve la mitad de memoria y p se redondea a 24 bits.
+        
+        Returns
+        -------
+        np.ndarray : Arreglo np.uint8 con n valores {0,1}
         """
-        return [1 if self.lcg() < p else 0 for _ in range(n)]
+        dtype = PRECISIONES[self.precision]
+        return (self._xs128p_batch(n, dtype) < dtype(p)).view(np.uint8)
     
     def binomial(self, n_trials=10, p=0.5, n=1):
         """
         Distribución binomial B(n,p)
         
-        Suma de n_trials ensayos de Bernoulli.
+        Suma de n_trials ensayos de Bernoulli: se genera una matriz
+        (n, n_trials) de uniformes, se compara con p y se suma por fila.
+        Para más de BINOMIAL_MAX_ENSAYOS ensayos se usa la transformación
+        inversa sobre la CDF binomial.
         
         Parámetros
         ----------
@@ -155,15 +894,37 @@ class GeneradorAleatorios:
         
         Returns
         -------
-        list : Lista con n valores binomiales
+        np.ndarray : Arreglo con n valores binomiales
         """
-        return [sum(self.bernoulli(p, n_trials)) for _ in range(n)]
+        # Entero sin signo más angosto que admite el valor máximo n_trials
+        tipo = np.min_scalar_type(n_trials)
+        if n_trials > BINOMIAL_MAX_ENSAYOS:
+            cdf = _binomial_cdf(n_trials, p)
+            k = np.searchsorted(cdf, self._xs128p_batch(n), side='right')
+            return np.minimum(k, n_trials).astype(tipo)
+        
+        resultados = np.empty(n, dtype=tipo)
+        filas = max(1, BLOQUE_LCG // n_trials)
+        usar_jit = NUMBA_DISPONIBLE and n > UMBRAL_JIT
+        dtype = PRECISIONES[self.precision]
+        for inicio in range(0, n, filas):
+            m = min(filas, n - inicio)
+            if usar_jit:
+                # Mismos uniformes que la versión NumPy, sin la matriz intermedia
+                _binomial_kernel(self._xs128p_batch(m * n_trials, dtype), dtype(p), n_trials,
+                                 resultados[inicio:inicio + m])
+            else:
+                ensayos = self._bernoulli_batch(p, m * n_trials).reshape(m, n_trials)
+                resultados[inicio:inicio + m] = ensayos.sum(axis=1, dtype=tipo)
+        return resultados
     
     def poisson(self, lambd=1.0, n=1):
         """
         Distribución de Poisson Poi(λ)
         
-        Utiliza el algoritmo de Knuth.
+        Para λ < POISSON_LAMBDA_PTRS utiliza la transformación inversa
+        sobre la CDF tabulada; para λ mayores utiliza el algoritmo de
+        rechazo transformado PTRS de Hörmann.
         
         Parámetros
         ----------
@@ -172,24 +933,132 @@ class GeneradorAleatorios:
         
         Returns
         -------
-        list : Lista con n valores de Poisson
+        np.ndarray : Arreglo con n valores de Poisson
+        """
+        if lambd >= POISSON_LAMBDA_PTRS:
+            if NUMBA_DISPONIBLE and n > UMBRAL_JIT:
+                return self._ejecutar_kernel(_poisson_ptrs_kernel, np.empty(n, dtype=np.int64),
+                                             2.5, float(lambd))
+            return self._poisson_ptrs(lambd, n)
+        cdf = _poisson_cdf(lambd)
+        tipo = np.min_scalar_type(cdf.size - 1)
+        if NUMBA_DISPONIBLE and n > UMBRAL_JIT:
+            salida = np.empty(n, dtype=tipo)
+            _poisson_inversa_kernel(self._xs128p_batch(n), cdf, salida)
+            return salida
+        k = np.searchsorted(cdf, self._xs128p_batch(n), side='right')
+        return np.minimum(k, cdf.size - 1).astype(tipo)
+    
+    def _poisson_ptrs(self, lambd, n):
+        """
+        Poisson por rechazo transformado (PTRS, Hörmann 1993).
+        
+        Cada ronda genera pares (U, V) para todos los valores pendientes;
+        la mayoría se acepta con la prueba rápida y el resto se decide
+        comparando con el logaritmo de la función de probabilidad.
+        
+        Returns
+        -------
+        np.ndarray : Arreglo int64 con n valores de Poisson
         """
-        resultados = []
-        for _ in range(n):
-            L = np.exp(-lambd)
-            k = 0
-            p = 1.0
-            while p > L:
-                k += 1
-                p *= self.lcg()
-            resultados.append(k - 1)
+        slam = math.sqrt(lambd)
+        b = 0.931 + 2.53 * slam
+        a = -0.059 + 0.02483 * b
+        log_invalpha = math.log(1.1239 + 1.1328 / (b - 3.4))
+        vr = 0.9277 - 3.6224 / (b - 2)
+        
+        resultados = np.empty(n, dtype=np.int64)
+        pendientes = np.arange(n)
+        while pendientes.size:
+            m = pendientes.size
+            U = self._xs128p_batch(m) - 0.5
+            V = self._xs128p_batch(m)
+            us = 0.5 - np.abs(U)
+            with np.errstate(divide='ignore'):
+                k = np.floor((2 * a / us + b) * U + lambd + 0.43)
+            acepta = (us >= 0.07) & (V <= vr)
+            
+            resto = ~acepta & (k >= 0) & ~((us < 0.013) & (V > us))
+            if np.any(resto):
+                k_r, us_r, v_r = k[resto], us[resto], V[resto]
+                with np.errstate(divide='ignore'):
+                    izq = np.log(v_r) + log_invalpha - np.log(a / (us_r * us_r) + b)
+                acepta[resto] = izq <= stats.poisson.logpmf(k_r, lambd)
+            
+            resultados[pendientes[acepta]] = k[acepta]
+            pendientes = pendientes[~acepta]
         return resultados
 
+def leer_numeros(texto, estricto=False):
+    """
+    Extrae los números de un texto separado por comas, espacios o saltos de línea.
+
+    El caso habitual (solo números) se convierte de una vez con
+    np.fromstring; si el texto contiene valores no numéricos, como
+    encabezados, se descartan uno a uno, o con `estricto` se lanza
+    ValueError en el primero. Acepta str o bytes, de modo que un archivo
+    leído en binario no necesita decodificarse.
+
+    Returns
+    -------
+    np.ndarray : Arreglo float64 con los números encontrados
+    """
+    if isinstance(texto, bytes):
+        texto = texto.replace(b',', b' ')
+    else:
+        texto = texto.replace(',', ' ')
+    if not texto.strip():
+        # Sin ningún valor, fromstring devuelve [-1.0] en lugar de un arreglo vacío
+        return np.empty(0, dtype=np.float64)
+    with warnings.catch_warnings():
+        # fromstring solo avisa cuando encuentra un valor no numérico
+        warnings.simplefilter('error')
+        try:
+            return np.fromstring(texto, dtype=np.float64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            pass
+    numeros = []
+    for valor in texto.split():
+        try:
+            numeros.append(float(valor))
+        except ValueError:
+            if estricto:
+                raise
+    return np.array(numeros, dtype=np.float64)
+
+# Estilos de botones compartidos por todas las ventanas
+ESTILO_BOTON_MENU = {
+    'font': ("Segoe UI", 16, "bold"),
+    'bg': '#c19a6b',
+    'fg': '#4b2e05',
+    'activebackground': '#a67c52',
+    'activeforeground': '#ffffff',
+    'relief': 'flat',
+    'borderwidth': 2,
+    'cursor': 'hand2',
+    'width': 45,
+    'height': 2
+}
+
+ESTILO_BOTON_INFERIOR = {
+    'font': ("Segoe UI", 10, "bold"),
+    'relief': 'flat',
+    'cursor': 'hand2',
+    'width': 16,
+    'height': 1
+}
+
 class SimuStatsApp:
     def __init__(self, root):
         self.root = root
         self.root.title("SimuStats")
 
+        # Hilo de trabajo para generar datos sin bloquear la interfaz
+        self.ejecutor = ThreadPoolExecutor(max_workers=1)
+
+        # Generador compartido por toda la aplicación
+        self.gen = GeneradorAleatorios()
+
         # Obtener dimensiones de la pantalla
         ancho_pantalla = root.winfo_screenwidth()
         alto_pantalla = root.winfo_screenheight()
@@ -197,22 +1066,77 @@ class SimuStatsApp:
         # Configurar ventana en pantalla completa o tamaño específico
         self.root.geometry(f"{ancho_pantalla}x{alto_pantalla}")
 
-        # Cargar y configurar imagen de fondo (solo una vez)
+        # El lienzo se muestra de inmediato con un color sólido; la imagen de
+        # fondo se prepara en el hilo de trabajo y se coloca al estar lista
+        self.fondo = None
+        self.canvas = tk.Canvas(root, width=ancho_pantalla, height=alto_pantalla, bg='#2c3e50', highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.create_image(0, 0, image=self.fondo, anchor="nw", tags="fondo")
+        # Lienzos que muestran la imagen de fondo compartida
+        self.lienzos_fondo = [self.canvas]
+
+        ruta_fondo = ruta_recurso("fondo.jpg")
+        if os.path.exists(ruta_fondo):
+            futuro = self.ejecutor.submit(self._preparar_fondo, ruta_fondo, ancho_pantalla, alto_pantalla)
+            self.root.after(50, lambda: self._colocar_fondo(futuro))
+        else:
+            print(f"No se encontró la imagen de fondo: {ruta_fondo}")
+
+        self.crear_interfaz()
+
+    @staticmethod
+    def _preparar_fondo(ruta, ancho, alto):
+        """
+        Carga la imagen de fondo escalada al tamaño de la pantalla.
+        
+        El resultado se guarda como PNG en la carpeta de caché del usuario,
+        con un resumen del contenido del original y el tamaño en el nombre,
+        y se reutiliza mientras el original no cambie. Se usa el contenido y
+        no la fecha porque el ejecutable empaquetado extrae el original de
+        nuevo en cada inicio.
+        
+        Returns
+        -------
+        PIL.Image.Image : Imagen de ancho x alto
+        """
+        with open(ruta, 'rb') as f:
+            original = f.read()
+        resumen = hashlib.sha1(original).hexdigest()[:16]
+        nombre, _ = os.path.splitext(os.path.basename(ruta))
+        ruta_cache = os.path.join(RUTA_CACHE, f"{nombre}_{resumen}_{ancho}x{alto}.png")
+        if os.path.exists(ruta_cache):
+            try:
+                return Image.open(ruta_cache).convert("RGB")
+            except OSError:
+                pass
+        
+        img = Image.open(io.BytesIO(original))
+        # En JPEG, draft decodifica directamente a una escala reducida
+        img.draft("RGB", (ancho, alto))
+        img = img.convert("RGB").resize((ancho, alto), Image.Resampling.BILINEAR, reducing_gap=2.0)
         try:
-            ruta_fondo = r"C:\Users\user\OneDrive\Documents\SimuStats\fondo.jpg"
-            self.img_fondo = Image.open(ruta_fondo)
-            self.img_fondo = self.img_fondo.resize((ancho_pantalla, alto_pantalla), Image.Resampling.LANCZOS)
-            self.fondo = ImageTk.PhotoImage(self.img_fondo)
-
-            self.canvas = tk.Canvas(root, width=ancho_pantalla, height=alto_pantalla, highlightthickness=0)
-            self.canvas.pack(fill="both", expand=True)
-            self.canvas.create_image(0, 0, image=self.fondo, anchor="nw")
+            # Se escribe aparte y se reemplaza, para no dejar un PNG a medias
+            os.makedirs(RUTA_CACHE, exist_ok=True)
+            temporal = ruta_cache + '.tmp'
+            img.save(temporal, format='PNG')
+            os.replace(temporal, ruta_cache)
+        except OSError:
+            pass
+        return img
+
+    def _colocar_fondo(self, futuro):
+        """Coloca la imagen de fondo cuando el hilo de trabajo termina de prepararla."""
+        if not futuro.done():
+            self.root.after(50, lambda: self._colocar_fondo(futuro))
+            return
+        try:
+            # PhotoImage debe crearse en el hilo de Tk
+            self.fondo = ImageTk.PhotoImage(futuro.result())
+            self.lienzos_fondo = [c for c in self.lienzos_fondo if c.winfo_exists()]
+            for lienzo in self.lienzos_fondo:
+                lienzo.itemconfigure("fondo", image=self.fondo)
         except Exception as e:
             print(f"Error al cargar fondo: {e}")
-            self.canvas = tk.Canvas(root, width=ancho_pantalla, height=alto_pantalla, bg='#2c3e50', highlightthickness=0)
-            self.canvas.pack(fill="both", expand=True)
-
-        self.crear_interfaz()
 
     def crear_interfaz(self):
         centro_x = self.root.winfo_screenwidth() // 2
@@ -220,7 +1144,7 @@ class SimuStatsApp:
 
         # Cargar el logo
         try:
-            self.img_logo = Image.open(r"C:\Users\user\OneDrive\Documents\SimuStats\logo.jpg")
+            self.img_logo = Image.open(ruta_recurso("logo.jpg"))
             self.img_logo = self.img_logo.resize((400, 200), Image.Resampling.LANCZOS)
             self.logo = ImageTk.PhotoImage(self.img_logo)
             self.canvas.create_image(centro_x, centro_y - 150, image=self.logo, anchor="center")
@@ -259,7 +1183,7 @@ class SimuStatsApp:
         # Dibujar fondo nuevamente
         ancho_pantalla = self.root.winfo_screenwidth()
         alto_pantalla = self.root.winfo_screenheight()
-        self.canvas.create_image(0, 0, image=self.fondo, anchor="nw")
+        self.canvas.create_image(0, 0, image=self.fondo, anchor="nw", tags="fondo")
 
         # Frame de contenido
         frame_contenido = tk.Frame(self.canvas, bg='', highlightthickness=0)
@@ -272,20 +1196,6 @@ class SimuStatsApp:
                          bg='#c19a6b', fg="#181001", padx=40, pady=20)
         title.pack(fill="x", pady=20)
 
-        # --- Estilo de botones ---
-        btn_style = {
-            'font': ("Segoe UI", 16, "bold"),
-            'bg': '#c19a6b',
-            'fg': '#4b2e05',
-            'activebackground': '#a67c52',
-            'activeforeground': '#ffffff',
-            'relief': 'flat',
-            'borderwidth': 2,
-            'cursor': 'hand2',
-            'width': 45,
-            'height': 2
-        }
-
         # --- Botones del menú ---
         opciones = [
             ("1. Generación de Variables Aleatorias", self.ventana_generacion_aleatorios),
@@ -296,7 +1206,7 @@ class SimuStatsApp:
         ]
 
         for texto, comando in opciones:
-            btn = tk.Button(frame_contenido, text=texto, command=comando, **btn_style)
+            btn = tk.Button(frame_contenido, text=texto, command=comando, **ESTILO_BOTON_MENU)
             btn.pack(pady=12)
 
             # Efectos hover
@@ -310,6 +1220,119 @@ class SimuStatsApp:
                           bg='#000000', fg='#dddddd')
         footer.pack(pady=30)
 
+    def _guardar_grafico(self, ventana, fig, archivo_grafico, al_terminar):
+        """
+        Guarda el gráfico como PNG en el hilo de trabajo.
+        
+        Se guarda una copia de la figura (obtenida con pickle), de modo que
+        Tk puede seguir dibujando la original mientras se rasteriza. Al
+        terminar se llama a al_terminar() en el hilo de Tk, o se muestra
+        el error.
+        
+        La imagen se rasteriza una sola vez con el tamaño de la figura (sin
+        bbox_inches='tight', que obliga a una pasada extra de dibujo) en un
+        buffer en memoria, y se escribe con una sola llamada a un archivo
+        temporal que luego reemplaza al destino.
+        """
+        copia = pickle.loads(pickle.dumps(fig))
+        
+        def guardar():
+            buffer = io.BytesIO()
+            copia.savefig(buffer, format='png', dpi=DPI_GRAFICO, facecolor='#6b4423')
+            temporal = archivo_grafico + '.tmp'
+            with open(temporal, 'wb') as f:
+                f.write(buffer.getbuffer())
+            os.replace(temporal, archivo_grafico)
+        
+        futuro = self.ejecutor.submit(guardar)
+        espera = [None]  # id del after que revisa el guardado en curso
+        
+        def esperar():
+            espera[0] = None
+            if not ventana.winfo_exists():
+                return
+            if not futuro.done():
+                espera[0] = ventana.after(50, esperar)
+                return
+            try:
+                futuro.result()
+                al_terminar()
+            except Exception as e:
+                messagebox.showerror("Error", f"Error al guardar el gráfico: {str(e)}", parent=ventana)
+        
+        def cancelar_espera(event):
+            # Si la ventana se cierra mientras se guarda, la revisión pendiente
+            # quedaría apuntando a un comando de Tk ya eliminado
+            if event.widget is ventana and espera[0] is not None:
+                ventana.after_cancel(espera[0])
+                espera[0] = None
+        
+        ventana.bind("<Destroy>", cancelar_espera, add="+")
+        espera[0] = ventana.after(50, esperar)
+
+    @staticmethod
+    def _ajustar_scroll(canvas, frame, frame_id):
+        """
+        Mantiene el área scrolleable del canvas y el ancho de su frame interno.
+        
+        Se actualiza en cada <Configure> del frame y del canvas, pero el
+        ancho del frame solo se cambia cuando el del canvas cambió: cada
+        itemconfig provoca otra pasada de geometría y otro <Configure>.
+        """
+        ancho = [0]  # último ancho aplicado al frame interno
+        
+        def actualizar_scroll(event=None):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            nuevo = canvas.winfo_width()
+            if nuevo != ancho[0]:
+                canvas.itemconfig(frame_id, width=nuevo)
+                ancho[0] = nuevo
+        
+        frame.bind("<Configure>", actualizar_scroll)
+        canvas.bind("<Configure>", actualizar_scroll)
+
+    @staticmethod
+    def _vincular_rueda(ventana, canvas):
+        """
+        Desplaza el canvas con la rueda del mouse solo mientras el puntero
+        está sobre él o sobre su contenido.
+        
+        Los bind_all se activan al entrar al canvas, se retiran al salir de
+        él y también al destruir la ventana, para que no queden manejadores
+        apuntando a widgets inexistentes.
+        """
+        eventos = {
+            "<MouseWheel>": lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"),
+            "<Button-4>": lambda e: canvas.yview_scroll(-1, "units"),
+            "<Button-5>": lambda e: canvas.yview_scroll(1, "units"),
+        }
+        
+        activo = [False]  # evita volver a registrar al pasar entre widgets internos
+        
+        def activar(event):
+            if activo[0]:
+                return
+            for secuencia, funcion in eventos.items():
+                canvas.bind_all(secuencia, funcion)
+            activo[0] = True
+        
+        def desactivar():
+            if not activo[0]:
+                return
+            for secuencia in eventos:
+                canvas.unbind_all(secuencia)
+            activo[0] = False
+        
+        def al_salir(event):
+            # Pasar a un widget interno también genera <Leave> en el canvas
+            destino = canvas.winfo_containing(event.x_root, event.y_root)
+            if destino is None or not str(destino).startswith(str(canvas)):
+                desactivar()
+        
+        canvas.bind("<Enter>", activar)
+        canvas.bind("<Leave>", al_salir)
+        ventana.bind("<Destroy>", lambda e: desactivar() if e.widget is ventana else None, add="+")
+
     def ventana_generacion_aleatorios(self):
         """Ventana para generar variables aleatorias"""
         ventana = tk.Toplevel(self.root)
@@ -318,13 +1341,15 @@ class SimuStatsApp:
         ventana.configure(bg="#fcdea6")
 
         # --- Fondo OPTIMIZADO (reutiliza la imagen pre-cargada) ---
+        # self.fondo mantiene viva la imagen; si aún se está cargando,
+        # _colocar_fondo la asigna al terminar
         canvas_fondo = tk.Canvas(ventana, 
                         width=self.root.winfo_screenwidth(), 
                         height=self.root.winfo_screenheight(), 
                         highlightthickness=0)
         canvas_fondo.pack(fill="both", expand=True)
-        canvas_fondo.create_image(0, 0, image=self.fondo, anchor="nw")
-        canvas_fondo.image = self.fondo
+        canvas_fondo.create_image(0, 0, image=self.fondo, anchor="nw", tags="fondo")
+        self.lienzos_fondo.append(canvas_fondo)
 
         # --- Crear Frame contenedor con scroll ---
         contenedor_scroll = tk.Frame(canvas_fondo, bg="#b8945f")
@@ -351,17 +1376,7 @@ class SimuStatsApp:
         scrollbar.pack(side="right", fill="y")
         
         # Habilitar scroll con rueda del mouse
-        def _on_mousewheel(event):
-            canvas_scroll.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_mousewheel(event):
-            canvas_scroll.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        def _unbind_mousewheel(event):
-            canvas_scroll.unbind_all("<MouseWheel>")
-        
-        canvas_scroll.bind('<Enter>', _bind_mousewheel)
-        canvas_scroll.bind('<Leave>', _unbind_mousewheel)
+        self._vincular_rueda(ventana, canvas_scroll)
 
         # Título
         tk.Label(main_frame, text="Generación de Variables Aleatorias",
@@ -406,13 +1421,22 @@ class SimuStatsApp:
         dist_combo.pack(side="left", padx=5)
         dist_combo.current(0)
 
+        # Los cambios de las variables se atienden cuando Tk queda inactivo,
+        # una sola vez aunque la variable cambie varias veces seguidas
+        pendientes = set()
+
+        def programar(funcion):
+            if funcion not in pendientes:
+                pendientes.add(funcion)
+                ventana.after_idle(lambda: (pendientes.discard(funcion), funcion()))
+
         def actualizar_distribuciones(*args):
             if tipo_var.get() == "Discreta":
                 dist_combo['values'] = ["Bernoulli", "Binomial", "Poisson"]
             else:
                 dist_combo['values'] = ["Uniforme", "Exponencial", "Normal"]
             dist_combo.current(0)
-        tipo_var.trace('w', actualizar_distribuciones)
+        tipo_var.trace('w', lambda *args: programar(actualizar_distribuciones))
 
         # FILA 2: Semilla y N valores
         fila2 = tk.Frame(config_inner, bg='#6b4423')
@@ -443,6 +1467,12 @@ class SimuStatsApp:
                 font=("Segoe UI", 9),
                 bg='#d4a574', fg='#4b2e05').pack(side="left", padx=5)
 
+        # Uniformes float32 para Bernoulli y Binomial
+        precision_simple = tk.BooleanVar(value=False)
+        tk.Checkbutton(fila2, text="Precisión simple", variable=precision_simple,
+                    bg='#6b4423', fg='#f5deb3', selectcolor='#8b5a3c',
+                    font=("Segoe UI", 9)).pack(side="left", padx=(30, 5))
+
         # FILA 3: Parámetros + Botón Generar
         fila3 = tk.Frame(config_inner, bg='#6b4423')
         fila3.pack(fill="x", pady=5)
@@ -476,43 +1506,38 @@ class SimuStatsApp:
                 width=15, height=1)
         btn_generar.pack(side="right", padx=10)
 
+        # (etiqueta, valor inicial) de cada parámetro, por distribución
+        parametros_por_dist = {
+            "Bernoulli": [("p:", "0.5")],
+            "Binomial": [("n:", "10"), ("p:", "0.5")],
+            "Poisson": [("λ:", "3.0")],
+            "Uniforme": [("a:", "0"), ("b:", "1")],
+            "Exponencial": [("λ:", "1.0")],
+            "Normal": [("μ:", "0"), ("σ:", "1")],
+        }
+        campos_param = [(param1_label, param1_var), (param2_label, param2_var)]
+        con_param2 = [False]  # Si el segundo parámetro está visible
+
         def actualizar_parametros(*args):
-            dist = dist_var.get()
-            param2_label.pack_forget()
-            param2_entry.pack_forget()
-            
-            if dist == "Bernoulli":
-                param1_label.config(text="p:")
-                param1_var.set("0.5")
-            elif dist == "Binomial":
-                param1_label.config(text="n:")
-                param1_var.set("10")
-                param2_label.config(text="p:")
-                param2_var.set("0.5")
-                param2_label.pack(side="left", padx=(15, 5))
-                param2_entry.pack(side="left", padx=5)
-            elif dist == "Poisson":
-                param1_label.config(text="λ:")
-                param1_var.set("3.0")
-            elif dist == "Uniforme":
-                param1_label.config(text="a:")
-                param1_var.set("0")
-                param2_label.config(text="b:")
-                param2_var.set("1")
-                param2_label.pack(side="left", padx=(15, 5))
-                param2_entry.pack(side="left", padx=5)
-            elif dist == "Exponencial":
-                param1_label.config(text="λ:")
-                param1_var.set("1.0")
-            elif dist == "Normal":
-                param1_label.config(text="μ:")
-                param1_var.set("0")
-                param2_label.config(text="σ:")
-                param2_var.set("1")
+            especificacion = parametros_por_dist.get(dist_var.get())
+            if especificacion is None:
+                return
+            # El segundo campo solo se empaqueta o retira al cambiar de
+            # una distribución de un parámetro a una de dos, o al revés
+            dos_parametros = len(especificacion) == 2
+            if dos_parametros and not con_param2[0]:
                 param2_label.pack(side="left", padx=(15, 5))
                 param2_entry.pack(side="left", padx=5)
+            elif con_param2[0] and not dos_parametros:
+                param2_label.pack_forget()
+                param2_entry.pack_forget()
+            con_param2[0] = dos_parametros
+            
+            for (etiqueta, variable), (texto, valor) in zip(campos_param, especificacion):
+                etiqueta.config(text=texto)
+                variable.set(valor)
         
-        dist_var.trace('w', actualizar_parametros)
+        dist_var.trace('w', lambda *args: programar(actualizar_parametros))
 
         # === ÁREA DE RESULTADOS ===
         resultados_frame = tk.Frame(main_frame, bg='#8b6f47')
@@ -530,570 +1555,78 @@ class SimuStatsApp:
         ax.set_xlabel('Valor', color='#f5deb3')
         ax.set_ylabel('Frecuencia', color='#f5deb3')
         ax.tick_params(colors='#f5deb3')
+        ax.grid(True, alpha=0.3, color='#f5deb3')
 
-        canvas_grafico = FigureCanvasTkAgg(fig, grafico_frame)
-        canvas_grafico.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
-
-        # Panel derecho (datos + estadísticas)
-        datos_frame = tk.LabelFrame(resultados_frame, text="Datos y Estadísticas", 
-                                    font=("Segoe UI", 11, "bold"),
-                                    bg='#6b4423', fg='#f5deb3', 
-                                    relief='solid', bd=2, width=380)
-        datos_frame.pack(side="right", fill="both", padx=0)
-        datos_frame.pack_propagate(False)
-
-        # Datos generados
-        datos_text = scrolledtext.ScrolledText(datos_frame, wrap=tk.WORD, 
-                                            width=40, height=18,
-                                            font=("Courier", 9),
-                                            bg='#8b5a3c', fg='#f5deb3',
-                                            insertbackground='#f5deb3')
-        datos_text.pack(fill="both", expand=True, padx=8, pady=8)
-
-        # Estadísticas
-        stats_frame = tk.LabelFrame(datos_frame, text="Estadísticas", 
-                                    font=("Segoe UI", 10, "bold"),
-                                    bg='#6b4423', fg='#f5deb3')
-        stats_frame.pack(fill="x", padx=8, pady=(0, 8))
-
-        stats_text = tk.Text(stats_frame, height=6, width=40,
-                            font=("Courier", 9), bg='#8b5a3c', 
-                            fg='#d4a574', relief='flat')
-        stats_text.pack(padx=5, pady=5)
-
-        # Variables para almacenar datos y generador
-        datos_generados = []
-        generador_actual = [None]  # Lista para permitir modificación en función anidada
-
-        def generar_datos():
-            try:
-                n = int(n_var.get())
-                if n <= 0 or n > 1000000:
-                    messagebox.showerror("Error", "El número de valores debe estar entre 1 y 1,000,000", parent=ventana)
-                    return
-                
-                # Obtener o generar semilla
-                if auto_semilla.get():
-                    semilla = None
-                else:
-                    semilla_texto = semilla_var.get().strip()
-                    if semilla_texto:
-                        try:
-                            semilla = int(semilla_texto)
-                        except:
-                            messagebox.showerror("Error", "La semilla debe ser un número entero", parent=ventana)
-                            return
-                    else:
-                        semilla = None
-                
-                gen = GeneradorAleatorios(semilla)
-                generador_actual[0] = gen
-                
-                dist = dist_var.get()
-                
-                # Validaciones y generación según distribución
-                if dist == "Bernoulli":
-                    try:
-                        p = float(param1_var.get())
-                        if not 0 <= p <= 1:
-                            messagebox.showerror("Error", "El parámetro p debe estar entre 0 y 1", parent=ventana)
-                            return
-                        datos = gen.bernoulli(p, n)
-                    except ValueError:
-                        messagebox.showerror("Error", "El parámetro p debe ser un número válido", parent=ventana)
-                        return
-                
-                elif dist == "Binomial":
-                    try:
-                        n_trials = int(param1_var.get())
-                        p = float(param2_var.get())
-                        if n_trials <= 0:
-                            messagebox.showerror("Error", "El parámetro n debe ser mayor a 0", parent=ventana)
-                            return
-                        if not 0 <= p <= 1:
-                            messagebox.showerror("Error", "El parámetro p debe estar entre 0 y 1", parent=ventana)
-                            return
-                        datos = gen.binomial(n_trials, p, n)
-                    except ValueError:
-                        messagebox.showerror("Error", "Los parámetros deben ser números válidos", parent=ventana)
-                        return
-                
-                elif dist == "Poisson":
-                    try:
-                        lambd = float(param1_var.get())
-                        if lambd <= 0:
-                            messagebox.showerror("Error", "El parámetro λ debe ser mayor a 0", parent=ventana)
-                            return
-                        datos = gen.poisson(lambd, n)
-                    except ValueError:
-                        messagebox.showerror("Error", "El parámetro λ debe ser un número válido", parent=ventana)
-                        return
-                
-                elif dist == "Uniforme":
-                    try:
-                        a = float(param1_var.get())
-                        b = float(param2_var.get())
-                        if a >= b:
-                            messagebox.showerror("Error", "El parámetro a debe ser menor que b", parent=ventana)
-                            return
-                        datos = gen.uniforme(a, b, n)
-                    except ValueError:
-                        messagebox.showerror("Error", "Los parámetros deben ser números válidos", parent=ventana)
-                        return
-                
-                elif dist == "Exponencial":
-                    try:
-                        lambd = float(param1_var.get())
-                        if lambd <= 0:
-                            messagebox.showerror("Error", "El parámetro λ debe ser mayor a 0", parent=ventana)
-                            return
-                        datos = gen.exponencial(lambd, n)
-                    except ValueError:
-                        messagebox.showerror("Error", "El parámetro λ debe ser un número válido", parent=ventana)
-                        return
-                
-                elif dist == "Normal":
-                    try:
-                        mu = float(param1_var.get())
-                        sigma = float(param2_var.get())
-                        if sigma <= 0:
-                            messagebox.showerror("Error", "La desviación estándar σ debe ser mayor a 0", parent=ventana)
-                            return
-                        datos = gen.normal(mu, sigma, n)
-                    except ValueError:
-                        messagebox.showerror("Error", "Los parámetros deben ser números válidos", parent=ventana)
-                        return
-                
-                # Guardar datos generados
-                datos_generados.clear()
-                datos_generados.extend(datos)
-                
-                # Actualizar gráfico
-                ax.clear()
-                if tipo_var.get() == "Discreta":
-                    valores_unicos = sorted(set(datos))
-                    frecuencias = [datos.count(v) for v in valores_unicos]
-                    ax.bar(valores_unicos, frecuencias, color='#c19a6b', alpha=0.8, edgecolor='#4b2e05')
-                else:
-                    ax.hist(datos, bins=50, color='#c19a6b', alpha=0.8, edgecolor='#f5deb3')
-                
-                ax.set_title(f'Distribución {dist}', color='#f5deb3', fontsize=12, fontweight='bold')
-                ax.set_xlabel('Valor', color='#f5deb3')
-                ax.set_ylabel('Frecuencia', color='#f5deb3')
-                ax.tick_params(colors='#f5deb3')
-                ax.grid(True, alpha=0.3, color='#f5deb3')
-                canvas_grafico.draw()
-                
-                # Mostrar datos
-                datos_text.delete(1.0, tk.END)
-                datos_text.insert(tk.END, f"═══════════════════════════════════════\n")
-                datos_text.insert(tk.END, f"  DATOS GENERADOS\n")
-                datos_text.insert(tk.END, f"═══════════════════════════════════════\n\n")
-                datos_text.insert(tk.END, f"Primeros 100 valores:\n\n")
-                
-                for i, valor in enumerate(datos[:100]):
-                    datos_text.insert(tk.END, f"{valor:.4f}  ")
-                    if (i + 1) % 5 == 0:
-                        datos_text.insert(tk.END, "\n")
-                
-                if len(datos) > 100:
-                    datos_text.insert(tk.END, f"\n\n{'─'*39}\n")
-                    datos_text.insert(tk.END, f"💾 Se generaron {len(datos)} valores en total\n")
-                    datos_text.insert(tk.END, f"📊 Mostrando solo los primeros 100\n")
-                    datos_text.insert(tk.END, f"💡 Usa 'Exportar Datos' para ver todos\n")
-                    datos_text.insert(tk.END, f"{'─'*39}\n")
-                
-                # Auto-scroll al inicio
-                datos_text.see("1.0")
-                
-                # Actualizar estadísticas
-                stats_text.delete(1.0, tk.END)
-                media = np.mean(datos)
-                desv_std = np.std(datos)
-                varianza = np.var(datos)
-                minimo = np.min(datos)
-                maximo = np.max(datos)
-                mediana = np.median(datos)
-                
-                stats_info = f"""Media:          {media:.4f}
-Desv. Est.:     {desv_std:.4f}
-Varianza:       {varianza:.4f}
-Mínimo:         {minimo:.4f}
-Máximo:         {maximo:.4f}
-Mediana:        {mediana:.4f}
-Total valores:  {len(datos)}
-Semilla usada:  {gen.semilla}"""
-                
-                stats_text.insert(tk.END, stats_info)
-                
-                messagebox.showinfo("Éxito", f"Se generaron {len(datos)} valores exitosamente", parent=ventana)
-                
-            except ValueError as e:
-                messagebox.showerror("Error", f"Parámetros inválidos: {str(e)}", parent=ventana)
-            except Exception as e:
-                messagebox.showerror("Error", f"Error al generar datos: {str(e)}", parent=ventana)
-
-        # Conectar el botón con la función
-        btn_generar.config(command=generar_datos)
-
-        def exportar_datos():
-            if not datos_generados:
-                messagebox.showwarning("Advertencia", "No hay datos para exportar", parent=ventana)
-                return
-            
-            archivo = filedialog.asksaveasfilename(
-                parent=ventana,
-                defaultextension=".txt",
-                filetypes=[("Archivos de texto", "*.txt"), ("CSV", "*.csv"), ("Todos los archivos", "*.*")]
-            )
-            
-            if archivo:
-                try:
-                    es_csv = archivo.lower().endswith('.csv')
-                    
-                    with open(archivo, 'w', encoding='utf-8') as f:
-                        if es_csv:
-                            # Formato CSV
-                            f.write("indice,valor\n")
-                            for i, valor in enumerate(datos_generados, 1):
-                                f.write(f"{i},{valor:.6f}\n")
-                        else:
-                            # Formato texto detallado
-                            f.write(f"{'='*70}\n")
-                            f.write(f"SimuStats - Datos Generados\n")
-                            f.write(f"{'='*70}\n\n")
-                            f.write(f"Distribución:      {dist_var.get()}\n")
-                            f.write(f"Tipo:              {tipo_var.get()}\n")
-                            f.write(f"Fecha y hora:      {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                            f.write(f"Semilla utilizada: {generador_actual[0].semilla if generador_actual[0] else 'N/A'}\n")
-                            f.write(f"Total de valores:  {len(datos_generados)}\n\n")
-                            
-                            # Parámetros
-                            f.write(f"{'='*70}\n")
-                            f.write(f"PARÁMETROS DE LA DISTRIBUCIÓN\n")
-                            f.write(f"{'='*70}\n")
-                            dist = dist_var.get()
-                            if dist == "Bernoulli":
-                                f.write(f"p: {param1_var.get()}\n")
-                            elif dist == "Binomial":
-                                f.write(f"n: {param1_var.get()}\n")
-                                f.write(f"p: {param2_var.get()}\n")
-                            elif dist == "Poisson":
-                                f.write(f"λ: {param1_var.get()}\n")
-                            elif dist == "Uniforme":
-                                f.write(f"a: {param1_var.get()}\n")
-                                f.write(f"b: {param2_var.get()}\n")
-                            elif dist == "Exponencial":
-                                f.write(f"λ: {param1_var.get()}\n")
-                            elif dist == "Normal":
-                                f.write(f"μ: {param1_var.get()}\n")
-                                f.write(f"σ: {param2_var.get()}\n")
-                            
-                            # Estadísticas
-                            f.write(f"\n{'='*70}\n")
-                            f.write(f"ESTADÍSTICAS DESCRIPTIVAS\n")
-                            f.write(f"{'='*70}\n")
-                            f.write(f"Media:              {np.mean(datos_generados):.6f}\n")
-                            f.write(f"Desviación estándar: {np.std(datos_generados):.6f}\n")
-                            f.write(f"Varianza:           {np.var(datos_generados):.6f}\n")
-                            f.write(f"Mínimo:             {np.min(datos_generados):.6f}\n")
-                            f.write(f"Máximo:             {np.max(datos_generados):.6f}\n")
-                            f.write(f"Mediana:            {np.median(datos_generados):.6f}\n")
-                            
-                            # Datos
-                            f.write(f"\n{'='*70}\n")
-                            f.write(f"DATOS GENERADOS\n")
-                            f.write(f"{'='*70}\n\n")
-                            
-                            for i, valor in enumerate(datos_generados, 1):
-                                f.write(f"{i:6d}. {valor:.6f}\n")
-                    
-                    messagebox.showinfo("Éxito", f"Datos exportados exitosamente a:\n{archivo}", parent=ventana)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error al exportar: {str(e)}", parent=ventana)
-
-        # === BOTONES INFERIORES ===
-        botones_frame = tk.Frame(main_frame, bg='#8b6f47')
-        botones_frame.pack(fill="x", padx=40, pady=(5, 10))
-
-        btn_style = {
-            'font': ("Segoe UI", 10, "bold"),
-            'relief': 'flat',
-            'cursor': 'hand2',
-            'width': 16,
-            'height': 1
-        }
-
-        tk.Button(botones_frame, text="Exportar Datos", command=exportar_datos,
-                bg='#8b5a3c', fg='#f5deb3',
-                activebackground='#6b4423',
-                activeforeground='#ffffff',
-                **btn_style).pack(side="left", padx=5)
-
-        tk.Button(botones_frame, text="Cerrar Ventana", command=ventana.destroy,
-                bg='#a0522d', fg='#f5deb3',
-                activebackground='#8b4513',
-                activeforeground='#ffffff',
-                **btn_style).pack(side="left", padx=5)
-
-        # === BOTÓN VOLVER AL MENÚ ===
-        btn_volver = tk.Button(main_frame, text="← Volver al Menú Principal",
-                            command=lambda: [ventana.destroy(), self.mostrar_menu_principal()],
-                            font=("Segoe UI", 12, "bold"),
-                            bg='#c19a6b', fg='#4b2e05',
-                            activebackground='#a67c52',
-                            activeforeground='#ffffff',
-                            relief='flat', cursor='hand2',
-                            width=30, height=2)
-        btn_volver.pack(pady=12)
-            
-    def ventana_prueba_ajuste(self):
-        """Ventana para generar variables aleatorias"""
-        ventana = tk.Toplevel(self.root)
-        ventana.title("Generación de Variables Aleatorias")
-        ventana.state('zoomed')
-        ventana.configure(bg="#fcdea6")
-
-        # --- Fondo OPTIMIZADO (reutiliza la imagen pre-cargada) ---
-        canvas = tk.Canvas(ventana, 
-                        width=self.root.winfo_screenwidth(), 
-                        height=self.root.winfo_screenheight(), 
-                        highlightthickness=0)
-        canvas.pack(fill="both", expand=True)
-        canvas.create_image(0, 0, image=self.fondo, anchor="nw")
-        canvas.image = self.fondo
-
-        # --- Frame con Scrollbar ---
-        # Crear un canvas para el scroll
-        scroll_canvas = tk.Canvas(canvas, bg="#b8945f", highlightthickness=0)
-        scroll_canvas.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.92, relheight=0.92)
-        
-        # Scrollbar vertical
-        scrollbar = tk.Scrollbar(scroll_canvas, orient="vertical", command=scroll_canvas.yview)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Frame scrolleable
-        scrollable_frame = tk.Frame(scroll_canvas, bg="#b8945f")
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: scroll_canvas.configure(scrollregion=scroll_canvas.bbox("all"))
-        )
-        
-        scroll_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        scroll_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Habilitar scroll con rueda del mouse
-        def _on_mousewheel(event):
-            scroll_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        scroll_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        # Usar scrollable_frame en lugar de main_frame
-        main_frame = scrollable_frame
-
-        # Título
-        tk.Label(main_frame, text="Generación de Variables Aleatorias",
-                font=("Segoe UI", 18, "bold"),
-                bg='#4b2e05', fg='#d4a574').pack(pady=8)
-
-        # === Cuadro de Configuración ===
-        config_frame = tk.LabelFrame(main_frame, text="Configuración",
-                                    font=("Segoe UI", 10, "bold"),
-                                    bg='#6b4423', fg='#f5deb3',
-                                    relief='solid', bd=2)
-        config_frame.pack(fill="x", padx=30, pady=(5, 8))
-
-        # --- Contenedor interno ---
-        config_inner = tk.Frame(config_frame, bg='#6b4423')
-        config_inner.pack(fill="x", padx=8, pady=6)
-
-        # FILA 1: Tipo y Distribución
-        fila1 = tk.Frame(config_inner, bg='#6b4423')
-        fila1.pack(fill="x", pady=3)
-
-        # Tipo de variable
-        tk.Label(fila1, text="Tipo:", font=("Segoe UI", 10, "bold"),
-                bg='#6b4423', fg='#f5deb3').pack(side="left", padx=(0, 10))
-
-        tipo_var = tk.StringVar(value="Discreta")
-        tk.Radiobutton(fila1, text="Discreta", variable=tipo_var, value="Discreta",
-                    bg='#6b4423', fg='#f5deb3', selectcolor='#8b5a3c',
-                    font=("Segoe UI", 9)).pack(side="left", padx=5)
-        tk.Radiobutton(fila1, text="Continua", variable=tipo_var, value="Continua",
-                    bg='#6b4423', fg='#f5deb3', selectcolor='#8b5a3c',
-                    font=("Segoe UI", 9)).pack(side="left", padx=5)
-
-        # Distribución
-        tk.Label(fila1, text="Distribución:", font=("Segoe UI", 10, "bold"),
-                bg='#6b4423', fg='#f5deb3').pack(side="left", padx=(30, 10))
-
-        dist_var = tk.StringVar()
-        dist_combo = ttk.Combobox(fila1, textvariable=dist_var,
-                                values=["Bernoulli", "Binomial", "Poisson"],
-                                state="readonly", width=15, font=("Segoe UI", 9))
-        dist_combo.pack(side="left", padx=5)
-        dist_combo.current(0)
-
-        def actualizar_distribuciones(*args):
-            if tipo_var.get() == "Discreta":
-                dist_combo['values'] = ["Bernoulli", "Binomial", "Poisson"]
-            else:
-                dist_combo['values'] = ["Uniforme", "Exponencial", "Normal"]
-            dist_combo.current(0)
-        tipo_var.trace('w', actualizar_distribuciones)
-
-        # FILA 2: Semilla y N valores
-        fila2 = tk.Frame(config_inner, bg='#6b4423')
-        fila2.pack(fill="x", pady=3)
-
-        tk.Label(fila2, text="Semilla:", font=("Segoe UI", 10, "bold"),
-                bg='#6b4423', fg='#f5deb3').pack(side="left", padx=(0, 10))
-
-        semilla_var = tk.StringVar()
-        semilla_entry = tk.Entry(fila2, textvariable=semilla_var,
-                                width=12, font=("Segoe UI", 9),
-                                bg='#d4a574', fg='#4b2e05')
-        semilla_entry.pack(side="left", padx=5)
-
-        auto_semilla = tk.BooleanVar(value=True)
-        tk.Checkbutton(fila2, text="Auto", variable=auto_semilla,
-                    bg='#6b4423', fg='#f5deb3', selectcolor='#8b5a3c',
-                    font=("Segoe UI", 9),
-                    command=lambda: semilla_entry.config(
-                        state='disabled' if auto_semilla.get() else 'normal')).pack(side="left", padx=5)
-        semilla_entry.config(state='disabled')
-
-        tk.Label(fila2, text="N° valores:", font=("Segoe UI", 10, "bold"),
-                bg='#6b4423', fg='#f5deb3').pack(side="left", padx=(30, 10))
-
-        n_var = tk.StringVar(value="1000")
-        tk.Entry(fila2, textvariable=n_var, width=10,
-                font=("Segoe UI", 9),
-                bg='#d4a574', fg='#4b2e05').pack(side="left", padx=5)
-
-        # FILA 3: Parámetros + Botón Generar
-        fila3 = tk.Frame(config_inner, bg='#6b4423')
-        fila3.pack(fill="x", pady=3)
-
-        tk.Label(fila3, text="Parámetros:", font=("Segoe UI", 10, "bold"),
-                bg='#6b4423', fg='#f5deb3').pack(side="left", padx=(0, 10))
-
-        param1_label = tk.Label(fila3, text="p:", font=("Segoe UI", 10),
-                                bg='#6b4423', fg='#f5deb3')
-        param1_label.pack(side="left", padx=5)
-
-        param1_var = tk.StringVar(value="0.5")
-        tk.Entry(fila3, textvariable=param1_var, width=10,
-                font=("Segoe UI", 9),
-                bg='#d4a574', fg='#4b2e05').pack(side="left", padx=5)
-
-        param2_label = tk.Label(fila3, text="", font=("Segoe UI", 10),
-                                bg='#6b4423', fg='#f5deb3')
-        param2_var = tk.StringVar()
-        param2_entry = tk.Entry(fila3, textvariable=param2_var, width=10,
-                                font=("Segoe UI", 9),
-                                bg='#d4a574', fg='#4b2e05')
-
-        # Botón Generar Datos
-        btn_generar = tk.Button(fila3, text="Generar Datos",
-                font=("Segoe UI", 10, "bold"),
-                bg='#c19a6b', fg='#4b2e05',
-                activebackground='#a67c52',
-                activeforeground='#ffffff',
-                relief='flat', cursor='hand2',
-                width=15, height=1)
-        btn_generar.pack(side="right", padx=10)
-
-        def actualizar_parametros(*args):
-            dist = dist_var.get()
-            param2_label.pack_forget()
-            param2_entry.pack_forget()
-            
-            if dist == "Bernoulli":
-                param1_label.config(text="p:")
-                param1_var.set("0.5")
-            elif dist == "Binomial":
-                param1_label.config(text="n:")
-                param1_var.set("10")
-                param2_label.config(text="p:")
-                param2_var.set("0.5")
-                param2_label.pack(side="left", padx=(15, 5))
-                param2_entry.pack(side="left", padx=5)
-            elif dist == "Poisson":
-                param1_label.config(text="λ:")
-                param1_var.set("3.0")
-            elif dist == "Uniforme":
-                param1_label.config(text="a:")
-                param1_var.set("0")
-                param2_label.config(text="b:")
-                param2_var.set("1")
-                param2_label.pack(side="left", padx=(15, 5))
-                param2_entry.pack(side="left", padx=5)
-            elif dist == "Exponencial":
-                param1_label.config(text="λ:")
-                param1_var.set("1.0")
-            elif dist == "Normal":
-                param1_label.config(text="μ:")
-                param1_var.set("0")
-                param2_label.config(text="σ:")
-                param2_var.set("1")
-                param2_label.pack(side="left", padx=(15, 5))
-                param2_entry.pack(side="left", padx=5)
-        
-        dist_var.trace('w', actualizar_parametros)
-
-        # === ÁREA DE RESULTADOS ===
-        resultados_frame = tk.Frame(main_frame, bg='#8b6f47', height=450)
-        resultados_frame.pack(fill="x", padx=30, pady=(0, 5))
-        resultados_frame.pack_propagate(False)
-
-        # Gráfico
-        grafico_frame = tk.LabelFrame(resultados_frame, text="Visualización", 
-                                    font=("Segoe UI", 10, "bold"),
-                                    bg='#6b4423', fg='#f5deb3', 
-                                    relief='solid', bd=2, height=440)
-        grafico_frame.pack(side="left", fill="both", expand=True, padx=(0, 8))
-        grafico_frame.pack_propagate(False)
-
-        fig = Figure(figsize=(6, 4), dpi=90, facecolor='#6b4423')
-        ax = fig.add_subplot(111, facecolor='#8b5a3c')
-        ax.set_xlabel('Valor', color='#f5deb3')
-        ax.set_ylabel('Frecuencia', color='#f5deb3')
-        ax.tick_params(colors='#f5deb3')
+        # Las barras se crean una vez y luego solo se actualizan
+        barras = [None]  # (tipo, BarContainer) del último gráfico
+        titulo_actual = [None]
 
         canvas_grafico = FigureCanvasTkAgg(fig, grafico_frame)
         canvas_grafico.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
 
         # Panel derecho (datos + estadísticas)
         datos_frame = tk.LabelFrame(resultados_frame, text="Datos y Estadísticas", 
-                                    font=("Segoe UI", 10, "bold"),
+                                    font=("Segoe UI", 11, "bold"),
                                     bg='#6b4423', fg='#f5deb3', 
-                                    relief='solid', bd=2, width=350, height=440)
+                                    relief='solid', bd=2, width=380)
         datos_frame.pack(side="right", fill="both", padx=0)
         datos_frame.pack_propagate(False)
 
         # Datos generados
         datos_text = scrolledtext.ScrolledText(datos_frame, wrap=tk.WORD, 
-                                            width=38, height=15,
-                                            font=("Courier", 8),
+                                            width=40, height=18,
+                                            font=("Courier", 9),
                                             bg='#8b5a3c', fg='#f5deb3',
                                             insertbackground='#f5deb3')
-        datos_text.pack(fill="both", expand=True, padx=6, pady=6)
+        datos_text.pack(fill="both", expand=True, padx=8, pady=8)
 
         # Estadísticas
         stats_frame = tk.LabelFrame(datos_frame, text="Estadísticas", 
-                                    font=("Segoe UI", 9, "bold"),
+                                    font=("Segoe UI", 10, "bold"),
                                     bg='#6b4423', fg='#f5deb3')
-        stats_frame.pack(fill="x", padx=6, pady=(0, 6))
+        stats_frame.pack(fill="x", padx=8, pady=(0, 8))
 
-        stats_text = tk.Text(stats_frame, height=7, width=38,
-                            font=("Courier", 8), bg='#8b5a3c', 
+        stats_text = tk.Text(stats_frame, height=6, width=40,
+                            font=("Courier", 9), bg='#8b5a3c', 
                             fg='#d4a574', relief='flat')
-        stats_text.pack(padx=4, pady=4)
+        stats_text.pack(padx=5, pady=5)
+        # Solo lectura: se habilita un momento al actualizarlo
+        stats_text.config(state='disabled')
 
         # Variables para almacenar datos y generador
-        datos_generados = []
-        generador_actual = [None]  # Lista para permitir modificación en función anidada
+        datos_generados = [None]  # Arreglo de la última generación
+        semilla_usada = [None]  # Semilla y posición del flujo de la última generación
+        estadisticas = [None]  # Estadísticas de la última generación, para exportar
+        vista_previa = [None]  # Clave del texto mostrado en datos_text
+        borrar_estado = [None]  # Id del after() que limpia el mensaje de estado
+        espera = [None]  # Id del after() que revisa la generación en curso
+
+        def cancelar_espera(event):
+            # Al cerrar la ventana con una generación en curso, la revisión
+            # pendiente quedaría apuntando a un comando de Tk ya eliminado
+            if event.widget is ventana and espera[0] is not None:
+                ventana.after_cancel(espera[0])
+                espera[0] = None
+
+        ventana.bind("<Destroy>", cancelar_espera, add="+")
+
+        def mostrar_estado(texto, duracion=None):
+            """Muestra un mensaje en la barra inferior; si hay duración (ms), luego lo borra."""
+            if borrar_estado[0] is not None:
+                ventana.after_cancel(borrar_estado[0])
+                borrar_estado[0] = None
+            estado_label.config(text=texto)
+            if duracion is not None:
+                borrar_estado[0] = ventana.after(duracion, lambda: estado_label.config(text=""))
+
+        def cancelar_borrado(event):
+            # El mensaje puede seguir en pantalla al cerrar la ventana; su
+            # borrado pendiente quedaría apuntando a un widget ya destruido
+            if event.widget is ventana and borrar_estado[0] is not None:
+                ventana.after_cancel(borrar_estado[0])
+                borrar_estado[0] = None
+
+        ventana.bind("<Destroy>", cancelar_borrado, add="+")
 
         def generar_datos():
             try:
@@ -1116,19 +1649,23 @@ Semilla usada:  {gen.semilla}"""
                     else:
                         semilla = None
                 
-                gen = GeneradorAleatorios(semilla)
-                generador_actual[0] = gen
+                # Se reutiliza el generador de la aplicación; solo se
+                # resiembra cuando el usuario indica una semilla
+                gen = self.gen
                 
+                # Tipo y distribución se fijan al lanzar la tarea: los radios
+                # siguen activos mientras se genera en segundo plano
                 dist = dist_var.get()
+                tipo = tipo_var.get()
                 
-                # Validaciones y generación según distribución
+                # Validaciones según distribución; la generación se prepara como tarea
                 if dist == "Bernoulli":
                     try:
                         p = float(param1_var.get())
                         if not 0 <= p <= 1:
                             messagebox.showerror("Error", "El parámetro p debe estar entre 0 y 1", parent=ventana)
                             return
-                        datos = gen.bernoulli(p, n)
+                        tarea = partial(gen.bernoulli, p, n)
                     except ValueError:
                         messagebox.showerror("Error", "El parámetro p debe ser un número válido", parent=ventana)
                         return
@@ -1143,95 +1680,211 @@ Semilla usada:  {gen.semilla}"""
                         if not 0 <= p <= 1:
                             messagebox.showerror("Error", "El parámetro p debe estar entre 0 y 1", parent=ventana)
                             return
-                        datos = gen.binomial(n_trials, p, n)
+                        tarea = partial(gen.binomial, n_trials, p, n)
                     except ValueError:
                         messagebox.showerror("Error", "Los parámetros deben ser números válidos", parent=ventana)
                         return
                 
-                # Guardar datos generados
-                datos_generados.clear()
-                datos_generados.extend(datos)
-                
-                # Actualizar gráfico
-                ax.clear()
-                if tipo_var.get() == "Discreta":
-                    valores_unicos = sorted(set(datos))
-                    frecuencias = [datos.count(v) for v in valores_unicos]
-                    ax.bar(valores_unicos, frecuencias, color='#c19a6b', alpha=0.8, edgecolor='#4b2e05')
-                else:
-                    ax.hist(datos, bins=50, color='#c19a6b', alpha=0.8, edgecolor='#f5deb3')
-                
-                ax.set_title(f'Distribución {dist}', color='#f5deb3', fontsize=12, fontweight='bold')
-                ax.set_xlabel('Valor', color='#f5deb3')
-                ax.set_ylabel('Frecuencia', color='#f5deb3')
-                ax.tick_params(colors='#f5deb3')
-                ax.grid(True, alpha=0.3, color='#f5deb3')
-                canvas_grafico.draw()
+                elif dist == "Poisson":
+                    try:
+                        lambd = float(param1_var.get())
+                        if lambd <= 0:
+                            messagebox.showerror("Error", "El parámetro λ debe ser mayor a 0", parent=ventana)
+                            return
+                        tarea = partial(gen.poisson, lambd, n)
+                    except ValueError:
+                        messagebox.showerror("Error", "El parámetro λ debe ser un número válido", parent=ventana)
+                        return
                 
-                # Mostrar datos
-                datos_text.delete(1.0, tk.END)
-                datos_text.insert(tk.END, f"═══════════════════════════════════════\n")
-                datos_text.insert(tk.END, f"  DATOS GENERADOS\n")
-                datos_text.insert(tk.END, f"═══════════════════════════════════════\n\n")
-                datos_text.insert(tk.END, f"Primeros 100 valores:\n\n")
+                elif dist == "Uniforme":
+                    try:
+                        a = float(param1_var.get())
+                        b = float(param2_var.get())
+                        if a >= b:
+                            messagebox.showerror("Error", "El parámetro a debe ser menor que b", parent=ventana)
+                            return
+                        tarea = partial(gen.uniforme, a, b, n)
+                    except ValueError:
+                        messagebox.showerror("Error", "Los parámetros deben ser números válidos", parent=ventana)
+                        return
                 
-                for i, valor in enumerate(datos[:100]):
-                    datos_text.insert(tk.END, f"{valor:.4f}  ")
-                    if (i + 1) % 5 == 0:
-                        datos_text.insert(tk.END, "\n")
+                elif dist == "Exponencial":
+                    try:
+                        lambd = float(param1_var.get())
+                        if lambd <= 0:
+                            messagebox.showerror("Error", "El parámetro λ debe ser mayor a 0", parent=ventana)
+                            return
+                        tarea = partial(gen.exponencial, lambd, n)
+                    except ValueError:
+                        messagebox.showerror("Error", "El parámetro λ debe ser un número válido", parent=ventana)
+                        return
                 
-                if len(datos) > 100:
-                    datos_text.insert(tk.END, f"\n\n{'─'*39}\n")
-                    datos_text.insert(tk.END, f"💾 Se generaron {len(datos)} valores en total\n")
-                    datos_text.insert(tk.END, f"📊 Mostrando solo los primeros 100\n")
-                    datos_text.insert(tk.END, f"💡 Usa 'Exportar Datos' para ver todos\n")
-                    datos_text.insert(tk.END, f"{'─'*39}\n")
+                elif dist == "Normal":
+                    try:
+                        mu = float(param1_var.get())
+                        sigma = float(param2_var.get())
+                        if sigma <= 0:
+                            messagebox.showerror("Error", "La desviación estándar σ debe ser mayor a 0", parent=ventana)
+                            return
+                        tarea = partial(gen.normal, mu, sigma, n)
+                    except ValueError:
+                        messagebox.showerror("Error", "Los parámetros deben ser números válidos", parent=ventana)
+                        return
                 
-                # Auto-scroll al inicio
-                datos_text.see("1.0")
+                # Generar en segundo plano para no bloquear la ventana
+                precision = 'float32' if precision_simple.get() else 'float64'
+                
+                def generar_en_hilo():
+                    gen.precision = precision
+                    if semilla is not None:
+                        gen.resembrar(semilla)
+                    # Con la semilla y la posición se puede reproducir la
+                    # generación: resembrar(semilla) y saltar_adelante(posicion)
+                    if gen.posicion:
+                        origen = f"{gen.semilla} (+{gen.posicion})"
+                    else:
+                        origen = str(gen.semilla)
+                    return tarea(), origen
                 
-                # Actualizar estadísticas
-                stats_text.delete(1.0, tk.END)
-                media = np.mean(datos)
-                desv_std = np.std(datos)
-                varianza = np.var(datos)
-                minimo = np.min(datos)
-                maximo = np.max(datos)
-                mediana = np.median(datos)
+                btn_generar.config(state='disabled', text="Generando...")
+                futuro = self.ejecutor.submit(generar_en_hilo)
+                espera[0] = ventana.after(50, lambda: esperar_resultado(futuro, dist, tipo))
                 
-                stats_info = f"""Media:          {media:.4f}
+            except ValueError as e:
+                messagebox.showerror("Error", f"Parámetros inválidos: {str(e)}", parent=ventana)
+            except Exception as e:
+                messagebox.showerror("Error", f"Error al generar datos: {str(e)}", parent=ventana)
+
+        def esperar_resultado(futuro, dist, tipo):
+            """Revisa periódicamente la tarea y muestra el resultado al terminar."""
+            espera[0] = None
+            if not ventana.winfo_exists():
+                return
+            if not futuro.done():
+                espera[0] = ventana.after(50, lambda: esperar_resultado(futuro, dist, tipo))
+                return
+            
+            btn_generar.config(state='normal', text="Generar Datos")
+            try:
+                datos, origen = futuro.result()
+                mostrar_resultado(datos, origen, dist, tipo)
+            except Exception as e:
+                messagebox.showerror("Error", f"Error al generar datos: {str(e)}", parent=ventana)
+
+        def mostrar_vista_previa(datos):
+            """Muestra los primeros 100 valores en datos_text con una sola inserción."""
+            texto = [
+                "═══════════════════════════════════════\n",
+                "  DATOS GENERADOS\n",
+                "═══════════════════════════════════════\n\n",
+                "Primeros 100 valores:\n\n",
+            ]
+            
+            for i, valor in enumerate(datos[:100]):
+                texto.append(f"{valor:.4f}  ")
+                if (i + 1) % 5 == 0:
+                    texto.append("\n")
+            
+            if len(datos) > 100:
+                texto.append(f"\n\n{'─'*39}\n")
+                texto.append(f"💾 Se generaron {len(datos)} valores en total\n")
+                texto.append(f"📊 Mostrando solo los primeros 100\n")
+                texto.append(f"💡 Usa 'Exportar Datos' para ver todos\n")
+                texto.append(f"{'─'*39}\n")
+            
+            datos_text.replace("1.0", tk.END, "".join(texto))
+            
+            # Auto-scroll al inicio
+            datos_text.yview_moveto(0.0)
+
+        def mostrar_resultado(datos, origen, dist, tipo):
+            """Actualiza gráfico, vista previa y estadísticas con los datos generados."""
+            # Guardar datos generados
+            datos_generados[0] = datos
+            semilla_usada[0] = origen
+            
+            # Estadísticas primero: el mínimo y el máximo sirven de rango al histograma
+            media, desv_std, varianza, minimo, maximo = estadisticas_basicas(datos)
+            mediana = np.median(datos)
+            estadisticas[0] = (media, desv_std, varianza, minimo, maximo, mediana)
+            
+            # Actualizar gráfico (las barras se describen por borde izquierdo y ancho)
+            if tipo == "Discreta":
+                if maximo < MAX_VALOR_BINCOUNT:
+                    # Los valores discretos son enteros no negativos: una sola
+                    # pasada de bincount da todas las frecuencias
+                    frecuencias = np.bincount(datos)
+                    valores_unicos = np.flatnonzero(frecuencias)
+                    alturas = frecuencias[valores_unicos]
+                else:
+                    # Con λ muy grande el arreglo de bincount sería enorme
+                    valores_unicos, alturas = np.unique(datos, return_counts=True)
+                izquierdas = valores_unicos - 0.4
+                anchos = np.full(valores_unicos.size, 0.8)
+                borde = '#4b2e05'
+            else:
+                # Contar en NumPy y dibujar solo las 50 barras; con el rango
+                # ya conocido, np.histogram no vuelve a buscar mínimo y máximo
+                alturas, bordes = np.histogram(datos, bins=50, range=(minimo, maximo))
+                izquierdas = bordes[:-1]
+                anchos = np.diff(bordes)
+                borde = '#f5deb3'
+            
+            anterior = barras[0]
+            if anterior is not None and anterior[0] == tipo and len(anterior[1]) == alturas.size:
+                # Mismo tipo y cantidad de barras: se mueven los rectángulos existentes
+                for rect, x, w, h in zip(anterior[1], izquierdas, anchos, alturas):
+                    rect.set_x(x)
+                    rect.set_width(w)
+                    rect.set_height(h)
+            else:
+                if anterior is not None:
+                    anterior[1].remove()
+                contenedor = ax.bar(izquierdas, alturas, width=anchos, align='edge',
+                                    color='#c19a6b', alpha=0.8, edgecolor=borde)
+                barras[0] = (tipo, contenedor)
+            ax.relim()
+            ax.autoscale_view()
+            
+            if titulo_actual[0] != dist:
+                ax.set_title(f'Distribución {dist}', color='#f5deb3', fontsize=12, fontweight='bold')
+                titulo_actual[0] = dist
+            canvas_grafico.draw_idle()
+            
+            # Mostrar datos (se arma el texto completo y se inserta una sola vez);
+            # si los primeros 100 valores y el total no cambian, el texto es el mismo
+            clave = (datos[:100].tobytes(), datos.dtype.str, len(datos))
+            if clave != vista_previa[0]:
+                vista_previa[0] = clave
+                mostrar_vista_previa(datos)
+            
+            # Actualizar estadísticas
+            stats_info = f"""Media:          {media:.4f}
 Desv. Est.:     {desv_std:.4f}
 Varianza:       {varianza:.4f}
 Mínimo:         {minimo:.4f}
 Máximo:         {maximo:.4f}
 Mediana:        {mediana:.4f}
 Total valores:  {len(datos)}
-Semilla usada:  {gen.semilla}"""
-                
-                stats_text.insert(tk.END, stats_info)
-                
-                messagebox.showinfo("Éxito", f"Se generaron {len(datos)} valores exitosamente", parent=ventana)
-                
-            except ValueError as e:
-                messagebox.showerror("Error", f"Parámetros inválidos: {str(e)}", parent=ventana)
-            except Exception as e:
-                messagebox.showerror("Error", f"Error al generar datos: {str(e)}", parent=ventana)
+Semilla usada:  {origen}"""
+            
+            stats_text.config(state='normal')
+            stats_text.replace("1.0", tk.END, stats_info)
+            stats_text.config(state='disabled')
+            
+            mostrar_estado(f"✓ {len(datos)} valores generados (semilla {origen})")
 
         # Conectar el botón con la función
         btn_generar.config(command=generar_datos)
 
         def exportar_datos():
-            """
-            Exporta los datos generados a un archivo de texto o CSV
-            y también guarda el gráfico como imagen PNG.
-            """
-            if not datos_generados:
+            datos = datos_generados[0]
+            if datos is None:
                 messagebox.showwarning("Advertencia", "No hay datos para exportar", parent=ventana)
                 return
             
             archivo = filedialog.asksaveasfilename(
                 parent=ventana,
-                title="Guardar datos generados",
                 defaultextension=".txt",
                 filetypes=[("Archivos de texto", "*.txt"), ("CSV", "*.csv"), ("Todos los archivos", "*.*")]
             )
@@ -1240,13 +1893,12 @@ Semilla usada:  {gen.semilla}"""
                 try:
                     es_csv = archivo.lower().endswith('.csv')
                     
-                    # Exportar datos en texto/CSV con UTF-8
-                    with open(archivo, 'w', encoding='utf-8') as f:
+                    with open(archivo, 'w', encoding='utf-8', buffering=BUFFER_EXPORTACION,
+                              newline='\n') as f:
                         if es_csv:
                             # Formato CSV
                             f.write("indice,valor\n")
-                            for i, valor in enumerate(datos_generados, 1):
-                                f.write(f"{i},{valor:.6f}\n")
+                            escribir_filas(f, datos, "%d,%.6f\n")
                         else:
                             # Formato texto detallado
                             f.write(f"{'='*70}\n")
@@ -1255,8 +1907,8 @@ Semilla usada:  {gen.semilla}"""
                             f.write(f"Distribución:      {dist_var.get()}\n")
                             f.write(f"Tipo:              {tipo_var.get()}\n")
                             f.write(f"Fecha y hora:      {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                            f.write(f"Semilla utilizada: {generador_actual[0].semilla if generador_actual[0] else 'N/A'}\n")
-                            f.write(f"Total de valores:  {len(datos_generados)}\n\n")
+                            f.write(f"Semilla utilizada: {semilla_usada[0] or 'N/A'}\n")
+                            f.write(f"Total de valores:  {len(datos)}\n\n")
                             
                             # Parámetros
                             f.write(f"{'='*70}\n")
@@ -1283,78 +1935,57 @@ Semilla usada:  {gen.semilla}"""
                             f.write(f"\n{'='*70}\n")
                             f.write(f"ESTADÍSTICAS DESCRIPTIVAS\n")
                             f.write(f"{'='*70}\n")
-                            f.write(f"Media:               {np.mean(datos_generados):.6f}\n")
-                            f.write(f"Desviación estándar: {np.std(datos_generados):.6f}\n")
-                            f.write(f"Varianza:            {np.var(datos_generados):.6f}\n")
-                            f.write(f"Mínimo:              {np.min(datos_generados):.6f}\n")
-                            f.write(f"Máximo:              {np.max(datos_generados):.6f}\n")
-                            f.write(f"Mediana:             {np.median(datos_generados):.6f}\n")
+                            media, desv_std, varianza, minimo, maximo, mediana = estadisticas[0]
+                            f.write(f"Media:              {media:.6f}\n")
+                            f.write(f"Desviación estándar: {desv_std:.6f}\n")
+                            f.write(f"Varianza:           {varianza:.6f}\n")
+                            f.write(f"Mínimo:             {minimo:.6f}\n")
+                            f.write(f"Máximo:             {maximo:.6f}\n")
+                            f.write(f"Mediana:            {mediana:.6f}\n")
                             
                             # Datos
                             f.write(f"\n{'='*70}\n")
                             f.write(f"DATOS GENERADOS\n")
                             f.write(f"{'='*70}\n\n")
                             
-                            for i, valor in enumerate(datos_generados, 1):
-                                f.write(f"{i:6d}. {valor:.6f}\n")
-                    
-                    # Exportar gráfico como imagen PNG
-                    archivo_grafico = archivo.replace('.txt', '_grafico.png').replace('.csv', '_grafico.png')
-                    fig.savefig(archivo_grafico, dpi=300, bbox_inches='tight', facecolor='#6b4423')
+                            escribir_filas(f, datos, "%6d. %.6f\n")
                     
-                    messagebox.showinfo(
-                        "Éxito", 
-                        f"Datos exportados exitosamente:\n\n"
-                        f"Archivo: {archivo}\n"
-                        f"Gráfico: {archivo_grafico}",
-                        parent=ventana
-                    )
+                    mostrar_estado(f"✓ Datos exportados a {os.path.basename(archivo)}", 3000)
                 except Exception as e:
                     messagebox.showerror("Error", f"Error al exportar: {str(e)}", parent=ventana)
 
         # === BOTONES INFERIORES ===
-        botones_frame = tk.Frame(main_frame, bg='#b8945f')
-        botones_frame.pack(fill="x", padx=30, pady=(3, 5))
-
-        btn_style = {
-            'font': ("Segoe UI", 10, "bold"),
-            'relief': 'flat',
-            'cursor': 'hand2',
-            'width': 18,
-            'height': 1
-        }
+        botones_frame = tk.Frame(main_frame, bg='#8b6f47')
+        botones_frame.pack(fill="x", padx=40, pady=(5, 10))
 
-        btn_exportar = tk.Button(botones_frame, text="Exportar Datos", command=exportar_datos,
+        tk.Button(botones_frame, text="Exportar Datos", command=exportar_datos,
                 bg='#8b5a3c', fg='#f5deb3',
                 activebackground='#6b4423',
                 activeforeground='#ffffff',
-                **btn_style)
-        btn_exportar.pack(side="left", padx=8)
+                **ESTILO_BOTON_INFERIOR).pack(side="left", padx=5)
 
-        btn_cerrar = tk.Button(botones_frame, text="Cerrar Ventana", command=ventana.destroy,
+        tk.Button(botones_frame, text="Cerrar Ventana", command=ventana.destroy,
                 bg='#a0522d', fg='#f5deb3',
                 activebackground='#8b4513',
                 activeforeground='#ffffff',
-                **btn_style)
-        btn_cerrar.pack(side="left", padx=8)
+                **ESTILO_BOTON_INFERIOR).pack(side="left", padx=5)
 
-        # Efectos hover
-        btn_exportar.bind("<Enter>", lambda e: btn_exportar.config(bg='#6b4423'))
-        btn_exportar.bind("<Leave>", lambda e: btn_exportar.config(bg='#8b5a3c'))
-        btn_cerrar.bind("<Enter>", lambda e: btn_cerrar.config(bg='#8b4513'))
-        btn_cerrar.bind("<Leave>", lambda e: btn_cerrar.config(bg='#a0522d'))
+        # Estado de la última operación, sin cuadros de diálogo modales
+        estado_label = tk.Label(botones_frame, text="", font=("Segoe UI", 10),
+                                bg='#8b6f47', fg='#f5deb3')
+        estado_label.pack(side="left", padx=15)
 
         # === BOTÓN VOLVER AL MENÚ ===
-        btn_volver = tk.Button(main_frame, text="Volver al Menú Principal",
+        btn_volver = tk.Button(main_frame, text="← Volver al Menú Principal",
                             command=lambda: [ventana.destroy(), self.mostrar_menu_principal()],
-                            font=("Segoe UI", 10, "bold"),
+                            font=("Segoe UI", 12, "bold"),
                             bg='#c19a6b', fg='#4b2e05',
                             activebackground='#a67c52',
                             activeforeground='#ffffff',
                             relief='flat', cursor='hand2',
-                            width=28, height=1)
-        btn_volver.pack(pady=5)
-
+                            width=30, height=2)
+        btn_volver.pack(pady=12)
+            
     def ventana_prueba_ajuste(self):
         """Ventana para pruebas de ajuste de distribuciones con scroll completo"""
         ventana = tk.Toplevel(self.root)
@@ -1375,34 +2006,10 @@ Semilla usada:  {gen.semilla}"""
         frame_interno_id = canvas.create_window((0, 0), window=frame_interno, anchor="nw")
 
         # Ajusta tamaño del frame interno al canvas
-        def actualizar_scroll(event=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(frame_interno_id, width=canvas.winfo_width())
-
-        frame_interno.bind("<Configure>", actualizar_scroll)
-        canvas.bind("<Configure>", actualizar_scroll)
+        self._ajustar_scroll(canvas, frame_interno, frame_interno_id)
 
         # Scroll con rueda del mouse
-        def scroll_con_mouse(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", scroll_con_mouse)
-        
-        def scroll_arriba(event):
-            canvas.yview_scroll(-1, "units")
-        def scroll_abajo(event):
-            canvas.yview_scroll(1, "units")
-        
-        canvas.bind_all("<Button-4>", scroll_arriba)
-        canvas.bind_all("<Button-5>", scroll_abajo)
-        
-        def on_close():
-            canvas.unbind_all("<MouseWheel>")
-            canvas.unbind_all("<Button-4>")
-            canvas.unbind_all("<Button-5>")
-            ventana.destroy()
-        
-        ventana.protocol("WM_DELETE_WINDOW", on_close)
+        self._vincular_rueda(ventana, canvas)
 
         # -------------------- Marco principal --------------------
         main_frame = tk.Frame(frame_interno, bg='#b8945f')
@@ -1418,7 +2025,16 @@ Semilla usada:  {gen.semilla}"""
                                     bg='#6b4423', fg='#f5deb3', relief='solid', bd=2)
         entrada_frame.pack(fill="x", padx=10, pady=10)
 
-        datos_prueba = []
+        datos_prueba = [None]  # Arreglo con los datos a evaluar
+
+        def mostrar_datos(encabezado, numeros):
+            """Muestra el total y los primeros 50 valores con una sola inserción."""
+            muestra = numeros[:50]
+            filas = "".join("".join(f"{v:.4f}  " for v in muestra[i:i + 5]) + "\n"
+                            for i in range(0, len(muestra), 5))
+            datos_text.replace("1.0", tk.END,
+                               f"{encabezado}\nTotal de datos: {len(numeros)}\n\n"
+                               f"Primeros 50 valores:\n{filas}")
 
         def cargar_archivo():
             # Mantener ventana al frente
@@ -1436,27 +2052,11 @@ Semilla usada:  {gen.semilla}"""
 
             if archivo:
                 try:
-                    with open(archivo, 'r') as f:
-                        contenido = f.read()
-                        numeros = []
-                        for linea in contenido.split('\n'):
-                            # Reemplazar comas por espacios y separar valores
-                            for valor in linea.replace(',', ' ').split():
-                                try:
-                                    numeros.append(float(valor))
-                                except:
-                                    pass
-                        if numeros:
-                            datos_prueba.clear()
-                            datos_prueba.extend(numeros)
-                            datos_text.delete(1.0, tk.END)
-                            datos_text.insert(tk.END, f"Archivo cargado: {archivo}\n")
-                            datos_text.insert(tk.END, f"Total de datos: {len(numeros)}\n\n")
-                            datos_text.insert(tk.END, "Primeros 50 valores:\n")
-                            for i, val in enumerate(numeros[:50]):
-                                datos_text.insert(tk.END, f"{val:.4f}  ")
-                                if (i + 1) % 5 == 0:
-                                    datos_text.insert(tk.END, "\n")
+                    with open(archivo, 'rb') as f:
+                        numeros = leer_numeros(f.read())
+                        if numeros.size:
+                            datos_prueba[0] = numeros
+                            mostrar_datos(f"Archivo cargado: {archivo}", numeros)
                             messagebox.showinfo("Éxito", f"Se cargaron {len(numeros)} datos correctamente", parent=ventana)
                         else:
                             messagebox.showwarning("Advertencia", "No se encontraron datos válidos en el archivo", parent=ventana)
@@ -1490,20 +2090,11 @@ Semilla usada:  {gen.semilla}"""
 
             def procesar_datos():
                 try:
-                    texto = text_entrada.get(1.0, tk.END)
-                    texto = texto.replace(',', ' ').replace('\n', ' ')
-                    numeros = [float(x) for x in texto.split() if x.strip()]
-                    if numeros:
-                        datos_prueba.clear()
-                        datos_prueba.extend(numeros)
-                        datos_text.delete(1.0, tk.END)
-                        datos_text.insert(tk.END, f"Datos ingresados manualmente\n")
-                        datos_text.insert(tk.END, f"Total de datos: {len(numeros)}\n\n")
-                        datos_text.insert(tk.END, "Primeros 50 valores:\n")
-                        for i, val in enumerate(numeros[:50]):
-                            datos_text.insert(tk.END, f"{val:.4f}  ")
-                            if (i + 1) % 5 == 0:
-                                datos_text.insert(tk.END, "\n")
+                    # Lo escrito a mano se valida completo: un valor inválido es un error
+                    numeros = leer_numeros(text_entrada.get(1.0, tk.END), estricto=True)
+                    if numeros.size:
+                        datos_prueba[0] = numeros
+                        mostrar_datos("Datos ingresados manualmente", numeros)
                         manual_ventana.destroy()
                         messagebox.showinfo("Éxito", f"Se ingresaron {len(numeros)} datos correctamente", parent=ventana)
                         ventana.lift()
@@ -1566,6 +2157,12 @@ Semilla usada:  {gen.semilla}"""
         tk.Entry(dist_prueba_frame, textvariable=alpha_var, width=8,
                 font=("Segoe UI", 10)).pack(side="left", padx=5)
 
+        # Si K-S rechaza con p < α/100 no se calcula la prueba χ²
+        omitir_chi_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(dist_prueba_frame, text="Omitir χ² si K-S rechaza con claridad",
+                    variable=omitir_chi_var, bg='#6b4423', fg='#f5deb3', selectcolor='#8b5a3c',
+                    font=("Segoe UI", 9)).pack(side="left", padx=(20, 5))
+
         # -------------------- Resultados --------------------
         resultados_frame = tk.Frame(main_frame, bg='#b8945f')
         resultados_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -1578,6 +2175,16 @@ Semilla usada:  {gen.semilla}"""
 
         fig = Figure(figsize=(6,5), dpi=100, facecolor='#6b4423')
         ax = fig.add_subplot(111, facecolor='#d4a574')
+        ax.set_xlabel('Valores', fontsize=11, fontweight='bold', color='#4b2e05')
+        ax.set_ylabel('Densidad de Probabilidad', fontsize=11, fontweight='bold', color='#4b2e05')
+        ax.grid(True, alpha=0.3, linestyle='--')
+
+        # Cálculos que no dependen de α, reutilizados si solo cambia α
+        calculos = [None]  # dict con los resultados para (datos, distribución)
+
+        # El histograma y la curva se crean una vez y luego solo se actualizan
+        barras_ajuste = [None]  # BarContainer del último histograma
+        curva = [None]  # Line2D de la distribución teórica
         canvas_grafico = FigureCanvasTkAgg(fig, grafico_frame)
         canvas_grafico.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -1592,10 +2199,22 @@ Semilla usada:  {gen.semilla}"""
                                                     width=45, height=20, font=("Courier", 9),
                                                     bg='#d4a574', fg='#4b2e05', insertbackground='#4b2e05')
         resultados_text.pack(fill="both", expand=True, padx=10, pady=10)
+        resultados_text.config(state='disabled')
+
+        # Texto del último informe, para exportarlo sin volver a leer el widget
+        informe_actual = ['']
+
+        def escribir_resultados(texto):
+            """Reemplaza el informe en una sola operación y redibuja una vez."""
+            informe_actual[0] = texto
+            resultados_text.config(state='normal')
+            resultados_text.replace("1.0", tk.END, texto)
+            resultados_text.config(state='disabled')
+            resultados_text.update_idletasks()
 
         # -------------------- Función realizar_prueba --------------------
         def realizar_prueba_local():
-            if not datos_prueba:
+            if datos_prueba[0] is None:
                 messagebox.showwarning("Advertencia", "Debe cargar o ingresar datos primero", parent=ventana)
                 return
             
@@ -1609,260 +2228,323 @@ Semilla usada:  {gen.semilla}"""
                 return
             
             distribucion = dist_var.get()
-            datos = np.array(datos_prueba)
+            datos = datos_prueba[0]
+            
+            memo = calculos[0]
+            if memo is None or memo['datos'] is not datos or memo['distribucion'] != distribucion:
+                memo = calculos[0] = {'datos': datos, 'distribucion': distribucion}
             
-            # Limpiar resultados anteriores
-            resultados_text.delete(1.0, tk.END)
-            ax.clear()
+            # El informe se arma en memoria y reemplaza al anterior de una sola vez
+            buf = []
             
-            resultados_text.insert(tk.END, f"═══════════════════════════════════════════\n")
-            resultados_text.insert(tk.END, f"  PRUEBA DE AJUSTE DE DISTRIBUCIÓN\n")
-            resultados_text.insert(tk.END, f"═══════════════════════════════════════════\n\n")
-            resultados_text.insert(tk.END, f"Distribución a probar: {distribucion}\n")
-            resultados_text.insert(tk.END, f"Nivel de significancia (α): {alpha}\n")
-            resultados_text.insert(tk.END, f"Tamaño de muestra (n): {len(datos)}\n\n")
+            buf.append(f"═══════════════════════════════════════════\n")
+            buf.append(f"  PRUEBA DE AJUSTE DE DISTRIBUCIÓN\n")
+            buf.append(f"═══════════════════════════════════════════\n\n")
+            buf.append(f"Distribución a probar: {distribucion}\n")
+            buf.append(f"Nivel de significancia (α): {alpha}\n")
+            buf.append(f"Tamaño de muestra (n): {len(datos)}\n\n")
             
             # Estadísticos descriptivos
-            resultados_text.insert(tk.END, f"╔═══════════════════════════════════════╗\n")
-            resultados_text.insert(tk.END, f"║   ESTADÍSTICOS DESCRIPTIVOS           ║\n")
-            resultados_text.insert(tk.END, f"╚═══════════════════════════════════════╝\n")
-            resultados_text.insert(tk.END, f"Media (x̄):              {np.mean(datos):.4f}\n")
-            resultados_text.insert(tk.END, f"Mediana:                {np.median(datos):.4f}\n")
-            resultados_text.insert(tk.END, f"Desviación estándar(s): {np.std(datos, ddof=1):.4f}\n")
-            resultados_text.insert(tk.END, f"Varianza (s²):          {np.var(datos, ddof=1):.4f}\n")
-            resultados_text.insert(tk.END, f"Mínimo:                 {np.min(datos):.4f}\n")
-            resultados_text.insert(tk.END, f"Máximo:                 {np.max(datos):.4f}\n")
-            resultados_text.insert(tk.END, f"Rango:                  {np.max(datos)-np.min(datos):.4f}\n")
-            resultados_text.insert(tk.END, f"Cuartil 25%:            {np.percentile(datos, 25):.4f}\n")
-            resultados_text.insert(tk.END, f"Cuartil 75%:            {np.percentile(datos, 75):.4f}\n\n")
+            buf.append(f"╔═══════════════════════════════════════╗\n")
+            buf.append(f"║   ESTADÍSTICOS DESCRIPTIVOS           ║\n")
+            buf.append(f"╚═══════════════════════════════════════╝\n")
+            if 'descriptivos' not in memo:
+                # Momentos en una pasada y los tres cuantiles en una sola llamada
+                media, desv, varianza, minimo, maximo = estadisticas_basicas(datos)
+                q25, mediana, q75 = np.percentile(datos, [25, 50, 75])
+                n_datos = len(datos)
+                # Corrección de Bessel para la varianza muestral (ddof=1)
+                varianza_m = varianza * n_datos / (n_datos - 1) if n_datos > 1 else float('nan')
+                memo['descriptivos'] = (media, desv, varianza_m, minimo, maximo,
+                                        q25, mediana, q75)
+            (media, desv, varianza_m, minimo, maximo,
+             q25, mediana, q75) = memo['descriptivos']
+            buf.append(f"Media (x̄):              {media:.4f}\n")
+            buf.append(f"Mediana:                {mediana:.4f}\n")
+            buf.append(f"Desviación estándar(s): {math.sqrt(varianza_m):.4f}\n")
+            buf.append(f"Varianza (s²):          {varianza_m:.4f}\n")
+            buf.append(f"Mínimo:                 {minimo:.4f}\n")
+            buf.append(f"Máximo:                 {maximo:.4f}\n")
+            buf.append(f"Rango:                  {maximo-minimo:.4f}\n")
+            buf.append(f"Cuartil 25%:            {q25:.4f}\n")
+            buf.append(f"Cuartil 75%:            {q75:.4f}\n\n")
             
             try:
-                from scipy import stats
-                
-                # ESTIMACIÓN DE PARÁMETROS USANDO .fit()
-                if distribucion == "Normal":
-                    params = stats.norm.fit(datos)
-                    mu, sigma = params[0], params[1]
-                    params_text = f"μ = {mu:.4f}, σ = {sigma:.4f}"
-                    
-                elif distribucion == "Exponencial":
-                    params = stats.expon.fit(datos)
-                    # expon.fit retorna (loc, scale), scale = 1/λ
-                    loc, scale = params[0], params[1]
-                    lambd = 1 / scale if scale != 0 else 1
-                    params_text = f"λ = {lambd:.4f}"
-                    
-                elif distribucion == "Uniforme":
-                    params = stats.uniform.fit(datos)
-                    a, width = params[0], params[1]
-                    b = a + width
-                    params_text = f"a = {a:.4f}, b = {b:.4f}"
-                    
-                elif distribucion == "Poisson":
-                    # Para Poisson, estimar λ como la media
-                    lambd = np.mean(datos)
-                    params_text = f"λ = {lambd:.4f}"
+                if 'ajuste' not in memo:
+                    mu = sigma = loc = scale = a = b = lambd = None
+                    # ESTIMACIÓN DE PARÁMETROS USANDO .fit()
+                    if distribucion == "Normal":
+                        params = stats.norm.fit(datos)
+                        mu, sigma = params[0], params[1]
+                        params_text = f"μ = {mu:.4f}, σ = {sigma:.4f}"
+                        
+                    elif distribucion == "Exponencial":
+                        params = stats.expon.fit(datos)
+                        # expon.fit retorna (loc, scale), scale = 1/λ
+                        loc, scale = params[0], params[1]
+                        lambd = 1 / scale if scale != 0 else 1
+                        params_text = f"λ = {lambd:.4f}"
+                        
+                    elif distribucion == "Uniforme":
+                        params = stats.uniform.fit(datos)
+                        a, width = params[0], params[1]
+                        b = a + width
+                        params_text = f"a = {a:.4f}, b = {b:.4f}"
+                        
+                    elif distribucion == "Poisson":
+                        # Para Poisson, estimar λ como la media
+                        lambd = media
+                        params_text = f"λ = {lambd:.4f}"
+                    memo['ajuste'] = (params_text, mu, sigma, loc, scale, a, b, lambd)
+                params_text, mu, sigma, loc, scale, a, b, lambd = memo['ajuste']
                 
-                resultados_text.insert(tk.END, f"Parámetros estimados: {params_text}\n\n")
+                buf.append(f"Parámetros estimados: {params_text}\n\n")
                 
                 # ========== PRUEBA DE KOLMOGOROV-SMIRNOV ==========
-                resultados_text.insert(tk.END, f"╔═══════════════════════════════════════╗\n")
-                resultados_text.insert(tk.END, f"║   PRUEBA KOLMOGOROV-SMIRNOV (K-S)     ║\n")
-                resultados_text.insert(tk.END, f"╚═══════════════════════════════════════╝\n")
-                resultados_text.insert(tk.END, f"Hipótesis nula (H₀): Los datos siguen\n")
-                resultados_text.insert(tk.END, f"                     la distribución {distribucion}\n\n")
-                
-                if distribucion == "Normal":
-                    ks_stat, ks_pvalue = stats.kstest(datos, 'norm', args=(mu, sigma))
-                elif distribucion == "Exponencial":
-                    ks_stat, ks_pvalue = stats.kstest(datos, 'expon', args=(loc, scale))
-                elif distribucion == "Uniforme":
-                    ks_stat, ks_pvalue = stats.kstest(datos, 'uniform', args=(a, b-a))
-                elif distribucion == "Poisson":
-                    # Para Poisson discreto, usar método manual
-                    datos_sorted = np.sort(datos)
-                    cdf_empirica = np.arange(1, len(datos)+1) / len(datos)
-                    cdf_teorica = stats.poisson.cdf(datos_sorted, lambd)
-                    ks_stat = np.max(np.abs(cdf_empirica - cdf_teorica))
-                    ks_pvalue = stats.ksone.sf(ks_stat, len(datos))
+                buf.append(f"╔═══════════════════════════════════════╗\n")
+                buf.append(f"║   PRUEBA KOLMOGOROV-SMIRNOV (K-S)     ║\n")
+                buf.append(f"╚═══════════════════════════════════════╝\n")
+                buf.append(f"Hipótesis nula (H₀): Los datos siguen\n")
+                buf.append(f"                     la distribución {distribucion}\n\n")
+                
+                if 'ks' not in memo:
+                    datos_ordenados = None
+                    if distribucion == "Normal":
+                        ks_stat, ks_pvalue = stats.kstest(datos, 'norm', args=(mu, sigma))
+                    elif distribucion == "Exponencial":
+                        ks_stat, ks_pvalue = stats.kstest(datos, 'expon', args=(loc, scale))
+                    elif distribucion == "Uniforme":
+                        ks_stat, ks_pvalue = stats.kstest(datos, 'uniform', args=(a, b-a))
+                    elif distribucion == "Poisson":
+                        # Para Poisson discreto, usar método manual. Los datos
+                        # ordenados se reutilizan para el histograma y la CDF se
+                        # evalúa solo en los valores distintos
+                        datos_ordenados = np.sort(datos)
+                        nuevos = np.empty(len(datos_ordenados), dtype=bool)
+                        nuevos[0] = True
+                        np.not_equal(datos_ordenados[1:], datos_ordenados[:-1], out=nuevos[1:])
+                        cdf_unicos = stats.poisson.cdf(datos_ordenados[nuevos], lambd)
+                        cdf_empirica = np.arange(1, len(datos)+1) / len(datos)
+                        cdf_teorica = cdf_unicos[np.cumsum(nuevos) - 1]
+                        ks_stat = np.max(np.abs(cdf_empirica - cdf_teorica))
+                        ks_pvalue = stats.ksone.sf(ks_stat, len(datos))
+                    memo['ks'] = (ks_stat, ks_pvalue, datos_ordenados)
+                ks_stat, ks_pvalue, datos_ordenados = memo['ks']
                 
                 # Valor crítico K-S
                 ks_critico = stats.kstwo.ppf(1-alpha, len(datos))
                 
-                resultados_text.insert(tk.END, f"Estadístico D:      {ks_stat:.6f}\n")
-                resultados_text.insert(tk.END, f"Valor crítico D:    {ks_critico:.6f}\n")
-                resultados_text.insert(tk.END, f"Valor p:            {ks_pvalue:.6f}\n\n")
+                buf.append(f"Estadístico D:      {ks_stat:.6f}\n")
+                buf.append(f"Valor crítico D:    {ks_critico:.6f}\n")
+                buf.append(f"Valor p:            {ks_pvalue:.6f}\n\n")
                 
                 if ks_pvalue > alpha:
-                    resultados_text.insert(tk.END, f"✓ Decisión K-S: NO se rechaza H₀\n")
-                    resultados_text.insert(tk.END, f"  (p-value = {ks_pvalue:.4f} > α = {alpha})\n\n")
+                    buf.append(f"✓ Decisión K-S: NO se rechaza H₀\n")
+                    buf.append(f"  (p-value = {ks_pvalue:.4f} > α = {alpha})\n\n")
                     conclusion_ks = "AJUSTA"
                 else:
-                    resultados_text.insert(tk.END, f"✗ Decisión K-S: Se RECHAZA H₀\n")
-                    resultados_text.insert(tk.END, f"  (p-value = {ks_pvalue:.4f} ≤ α = {alpha})\n\n")
+                    buf.append(f"✗ Decisión K-S: Se RECHAZA H₀\n")
+                    buf.append(f"  (p-value = {ks_pvalue:.4f} ≤ α = {alpha})\n\n")
                     conclusion_ks = "NO AJUSTA"
                 
                 # ========== PRUEBA CHI-CUADRADO ==========
-                resultados_text.insert(tk.END, f"╔═══════════════════════════════════════╗\n")
-                resultados_text.insert(tk.END, f"║   PRUEBA CHI-CUADRADO (χ²)            ║\n")
-                resultados_text.insert(tk.END, f"╚═══════════════════════════════════════╝\n")
-                resultados_text.insert(tk.END, f"Hipótesis nula (H₀): Los datos siguen\n")
-                resultados_text.insert(tk.END, f"                     la distribución {distribucion}\n\n")
-                
-                # Crear intervalos (regla de Sturges)
-                k = int(1 + 3.322 * np.log10(len(datos)))
-                k = max(5, min(k, 15))
-                
-                observed, bins = np.histogram(datos, bins=k)
-                
-                # Calcular frecuencias esperadas ANTES de mostrar tabla
-                expected_list = []
-                for i in range(len(bins)-1):
-                    if distribucion == "Normal":
-                        p = stats.norm.cdf(bins[i+1], mu, sigma) - stats.norm.cdf(bins[i], mu, sigma)
-                    elif distribucion == "Exponencial":
-                        p = stats.expon.cdf(bins[i+1], loc, scale) - stats.expon.cdf(bins[i], loc, scale)
-                    elif distribucion == "Uniforme":
-                        p = stats.uniform.cdf(bins[i+1], a, b-a) - stats.uniform.cdf(bins[i], a, b-a)
-                    elif distribucion == "Poisson":
-                        p = stats.poisson.cdf(bins[i+1], lambd) - stats.poisson.cdf(bins[i], lambd)
+                buf.append(f"╔═══════════════════════════════════════╗\n")
+                buf.append(f"║   PRUEBA CHI-CUADRADO (χ²)            ║\n")
+                buf.append(f"╚═══════════════════════════════════════╝\n")
+                buf.append(f"Hipótesis nula (H₀): Los datos siguen\n")
+                buf.append(f"                     la distribución {distribucion}\n\n")
+                
+                if 'histograma' not in memo:
+                    # Crear intervalos (regla de Sturges)
+                    k = int(1 + 3.322 * np.log10(len(datos)))
+                    k = max(5, min(k, 15))
                     
-                    exp_freq = p * len(datos)
-                    expected_list.append(exp_freq)
-                
-                expected = np.array(expected_list)
-                observed_orig = observed.copy()
-                
-                # Combinar intervalos con frecuencias esperadas < 5 ANTES de mostrar
-                indices_combinar = []
-                while np.any(expected < 5) and len(expected) > 2:
-                    idx = np.argmin(expected)
-                    indices_combinar.append(idx)
-                    if idx == 0:
-                        observed[1] += observed[0]
-                        expected[1] += expected[0]
-                        observed = observed[1:]
-                        expected = expected[1:]
-                        bins = bins[1:]
-                    elif idx == len(expected) - 1:
-                        observed[-2] += observed[-1]
-                        expected[-2] += expected[-1]
-                        observed = observed[:-1]
-                        expected = expected[:-1]
-                        bins = bins[:-1]
+                    if distribucion == "Poisson":
+                        # Conteo sobre los datos ya ordenados: O(k log n)
+                        bins = np.histogram_bin_edges(datos, bins=k, range=(minimo, maximo))
+                        posiciones = np.searchsorted(datos_ordenados, bins)
+                        posiciones[-1] = len(datos_ordenados)
+                        observed = np.diff(posiciones)
                     else:
-                        observed[idx-1] += observed[idx]
-                        expected[idx-1] += expected[idx]
-                        observed = np.delete(observed, idx)
-                        expected = np.delete(expected, idx)
-                        bins = np.delete(bins, idx+1)
-                
-                resultados_text.insert(tk.END, f"Número de intervalos: {len(observed)}\n\n")
-                resultados_text.insert(tk.END, f"{'Intervalo':<20} {'Observado':<12} {'Esperado':<12}\n")
-                resultados_text.insert(tk.END, f"{'-'*44}\n")
-                
-                for i in range(len(observed)):
-                    intervalo = f"[{bins[i]:.2f}, {bins[i+1]:.2f})"
-                    resultados_text.insert(tk.END, f"{intervalo:<20} {observed[i]:<12} {expected[i]:<12.2f}\n")
-                
-                # Calcular estadístico Chi-cuadrado
-                chi2_stat = np.sum((observed - expected)**2 / expected)
-                
-                # Grados de libertad corregidos
-                if distribucion == "Normal":
-                    df = len(observed) - 1 - 2
-                elif distribucion == "Exponencial":
-                    df = len(observed) - 1 - 1
-                elif distribucion == "Uniforme":
-                    df = len(observed) - 1 - 2
-                elif distribucion == "Poisson":
-                    df = len(observed) - 1 - 1
-                
-                df = max(1, df)
-                
-                chi2_pvalue = 1 - stats.chi2.cdf(chi2_stat, df)
-                chi2_critico = stats.chi2.ppf(1-alpha, df)
-                
-                resultados_text.insert(tk.END, f"\n")
-                resultados_text.insert(tk.END, f"Estadístico χ²:     {chi2_stat:.4f}\n")
-                resultados_text.insert(tk.END, f"Grados de libertad: {df}\n")
-                resultados_text.insert(tk.END, f"Valor crítico χ²:   {chi2_critico:.4f}\n")
-                resultados_text.insert(tk.END, f"Valor p:            {chi2_pvalue:.6f}\n\n")
-                
-                if chi2_pvalue > alpha:
-                    resultados_text.insert(tk.END, f"✓ Decisión χ²: NO se rechaza H₀\n")
-                    resultados_text.insert(tk.END, f"  (p-value = {chi2_pvalue:.4f} > α = {alpha})\n\n")
-                    conclusion_chi = "AJUSTA"
+                        observed, bins = np.histogram(datos, bins=k, range=(minimo, maximo))
+                    memo['histograma'] = (k, observed, bins)
+                k, frecuencias_k, bordes_k = memo['histograma']
+                
+                if omitir_chi_var.get() and ks_pvalue < alpha * 0.01:
+                    # K-S ya rechaza con claridad: no se calculan esperados ni χ²
+                    buf.append(f"Prueba omitida: K-S rechaza H₀ con\n")
+                    buf.append(f"  p-value = {ks_pvalue:.2e} < α/100\n\n")
+                    conclusion_chi = "OMITIDA"
                 else:
-                    resultados_text.insert(tk.END, f"✗ Decisión χ²: Se RECHAZA H₀\n")
-                    resultados_text.insert(tk.END, f"  (p-value = {chi2_pvalue:.4f} ≤ α = {alpha})\n\n")
-                    conclusion_chi = "NO AJUSTA"
-                
+                    if 'chi' not in memo:
+                        observed, bins = frecuencias_k, bordes_k
+                        # Calcular frecuencias esperadas ANTES de mostrar tabla:
+                        # una sola evaluación de la CDF en todos los bordes
+                        if distribucion == "Normal":
+                            cdf_bordes = stats.norm.cdf(bins, mu, sigma)
+                        elif distribucion == "Exponencial":
+                            cdf_bordes = stats.expon.cdf(bins, loc, scale)
+                        elif distribucion == "Uniforme":
+                            cdf_bordes = stats.uniform.cdf(bins, a, b-a)
+                        elif distribucion == "Poisson":
+                            cdf_bordes = stats.poisson.cdf(bins, lambd)
+                        
+                        expected = np.diff(cdf_bordes) * len(datos)
+                        
+                        # Combinar intervalos con frecuencias esperadas < 5 ANTES de mostrar:
+                        # se recorre una vez de izquierda a derecha cerrando cada grupo
+                        # al llegar a 5 y el resto final se une al grupo anterior
+                        inicios = [0]
+                        acumulado = 0.0
+                        for i, esperado in enumerate(expected):
+                            acumulado += esperado
+                            if acumulado >= 5 and i + 1 < len(expected):
+                                inicios.append(i + 1)
+                                acumulado = 0.0
+                        if len(inicios) > 1 and acumulado < 5:
+                            inicios.pop()
+                        if len(inicios) == 1 and len(expected) > 1:
+                            # Conservar al menos dos intervalos partiendo por la mitad
+                            mitad = np.searchsorted(np.cumsum(expected), expected.sum() / 2) + 1
+                            inicios.append(int(min(max(mitad, 1), len(expected) - 1)))
+                        
+                        observed = np.add.reduceat(observed, inicios)
+                        expected = np.add.reduceat(expected, inicios)
+                        # Bordes finales: el inicio de cada grupo y el último borde
+                        bins = bins[inicios + [len(bins) - 1]]
+                        
+                        # Calcular estadístico Chi-cuadrado
+                        chi2_stat = np.sum((observed - expected)**2 / expected)
+                        
+                        # Grados de libertad corregidos
+                        if distribucion == "Normal":
+                            df = len(observed) - 1 - 2
+                        elif distribucion == "Exponencial":
+                            df = len(observed) - 1 - 1
+                        elif distribucion == "Uniforme":
+                            df = len(observed) - 1 - 2
+                        elif distribucion == "Poisson":
+                            df = len(observed) - 1 - 1
+                        
+                        df = max(1, df)
+                        
+                        chi2_pvalue = stats.chi2.sf(chi2_stat, df)
+                        memo['chi'] = (observed, expected, bins, chi2_stat, df, chi2_pvalue)
+                    observed, expected, bins, chi2_stat, df, chi2_pvalue = memo['chi']
+                    
+                    buf.append(f"Número de intervalos: {len(observed)}\n\n")
+                    buf.append(f"{'Intervalo':<20} {'Observado':<12} {'Esperado':<12}\n")
+                    buf.append(f"{'-'*44}\n")
+                    
+                    buf.append("".join(
+                        f"{f'[{izq:.2f}, {der:.2f})':<20} {obs:<12} {esp:<12.2f}\n"
+                        for izq, der, obs, esp in zip(bins[:-1].tolist(), bins[1:].tolist(),
+                                                      observed.tolist(), expected.tolist())))
+                    
+                    chi2_critico = stats.chi2.ppf(1-alpha, df)
+                    
+                    buf.append(f"\n")
+                    buf.append(f"Estadístico χ²:     {chi2_stat:.4f}\n")
+                    buf.append(f"Grados de libertad: {df}\n")
+                    buf.append(f"Valor crítico χ²:   {chi2_critico:.4f}\n")
+                    buf.append(f"Valor p:            {chi2_pvalue:.6f}\n\n")
+                    
+                    if chi2_pvalue > alpha:
+                        buf.append(f"✓ Decisión χ²: NO se rechaza H₀\n")
+                        buf.append(f"  (p-value = {chi2_pvalue:.4f} > α = {alpha})\n\n")
+                        conclusion_chi = "AJUSTA"
+                    else:
+                        buf.append(f"✗ Decisión χ²: Se RECHAZA H₀\n")
+                        buf.append(f"  (p-value = {chi2_pvalue:.4f} ≤ α = {alpha})\n\n")
+                        conclusion_chi = "NO AJUSTA"
+                    
                 # ========== CONCLUSIÓN FINAL ==========
-                resultados_text.insert(tk.END, f"╔═══════════════════════════════════════╗\n")
-                resultados_text.insert(tk.END, f"║   CONCLUSIÓN FINAL                    ║\n")
-                resultados_text.insert(tk.END, f"╚═══════════════════════════════════════╝\n")
-                
-                if conclusion_ks == "AJUSTA" and conclusion_chi == "AJUSTA":
-                    resultados_text.insert(tk.END, f"✓✓ AMBAS PRUEBAS CONCUERDAN:\n")
-                    resultados_text.insert(tk.END, f"   Los datos SE AJUSTAN a la\n")
-                    resultados_text.insert(tk.END, f"   distribución {distribucion}\n")
-                    resultados_text.insert(tk.END, f"   (nivel de confianza {(1-alpha)*100}%)\n")
+                buf.append(f"╔═══════════════════════════════════════╗\n")
+                buf.append(f"║   CONCLUSIÓN FINAL                    ║\n")
+                buf.append(f"╚═══════════════════════════════════════╝\n")
+                
+                if conclusion_chi == "OMITIDA":
+                    buf.append(f"✗ K-S RECHAZA CON CLARIDAD:\n")
+                    buf.append(f"   Los datos NO SE AJUSTAN a la\n")
+                    buf.append(f"   distribución {distribucion}\n")
+                    buf.append(f"   (χ² omitida)\n")
+                elif conclusion_ks == "AJUSTA" and conclusion_chi == "AJUSTA":
+                    buf.append(f"✓✓ AMBAS PRUEBAS CONCUERDAN:\n")
+                    buf.append(f"   Los datos SE AJUSTAN a la\n")
+                    buf.append(f"   distribución {distribucion}\n")
+                    buf.append(f"   (nivel de confianza {(1-alpha)*100}%)\n")
                 elif conclusion_ks == "NO AJUSTA" and conclusion_chi == "NO AJUSTA":
-                    resultados_text.insert(tk.END, f"✗✗ AMBAS PRUEBAS CONCUERDAN:\n")
-                    resultados_text.insert(tk.END, f"   Los datos NO SE AJUSTAN a la\n")
-                    resultados_text.insert(tk.END, f"   distribución {distribucion}\n")
-                    resultados_text.insert(tk.END, f"   (nivel de confianza {(1-alpha)*100}%)\n")
+                    buf.append(f"✗✗ AMBAS PRUEBAS CONCUERDAN:\n")
+                    buf.append(f"   Los datos NO SE AJUSTAN a la\n")
+                    buf.append(f"   distribución {distribucion}\n")
+                    buf.append(f"   (nivel de confianza {(1-alpha)*100}%)\n")
                 else:
-                    resultados_text.insert(tk.END, f"⚠ LAS PRUEBAS NO CONCUERDAN:\n")
-                    resultados_text.insert(tk.END, f"   K-S: {conclusion_ks}\n")
-                    resultados_text.insert(tk.END, f"   χ²:  {conclusion_chi}\n")
-                    resultados_text.insert(tk.END, f"   Se recomienda análisis adicional\n")
-                
-                # ========== GRAFICAR ==========
-                ax.clear()
+                    buf.append(f"⚠ LAS PRUEBAS NO CONCUERDAN:\n")
+                    buf.append(f"   K-S: {conclusion_ks}\n")
+                    buf.append(f"   χ²:  {conclusion_chi}\n")
+                    buf.append(f"   Se recomienda análisis adicional\n")
                 
-                n, bins_plot, patches = ax.hist(datos, bins=k, density=True, alpha=0.6, 
-                                            color='#8b6914', edgecolor='black', 
-                                            label='Datos observados')
+                escribir_resultados("".join(buf))
+                buf = None
                 
-                x = np.linspace(np.min(datos) - 0.1*np.std(datos), 
-                            np.max(datos) + 0.1*np.std(datos), 1000)
+                # ========== GRAFICAR ==========
+                # Densidad de los k intervalos originales (antes de combinar)
+                anchos = np.diff(bordes_k)
+                alturas = frecuencias_k / (len(datos) * anchos)
+                
+                anterior = barras_ajuste[0]
+                if anterior is not None and len(anterior) == alturas.size:
+                    # Misma cantidad de barras: se mueven los rectángulos existentes
+                    for rect, x0, w, h in zip(anterior, bordes_k[:-1], anchos, alturas):
+                        rect.set_x(x0)
+                        rect.set_width(w)
+                        rect.set_height(h)
+                else:
+                    if anterior is not None:
+                        anterior.remove()
+                    barras_ajuste[0] = ax.bar(bordes_k[:-1], alturas, width=anchos, align='edge',
+                                              alpha=0.6, color='#8b6914', edgecolor='black',
+                                              label='Datos observados')
+                
+                if distribucion == "Poisson":
+                    x = np.arange(int(minimo), int(maximo)+1)
+                    y = stats.poisson.pmf(x, lambd)
+                else:
+                    # 200 puntos bastan para una curva suave
+                    x = np.linspace(minimo - 0.1*desv, maximo + 0.1*desv, 200)
+                    if distribucion == "Normal":
+                        y = stats.norm.pdf(x, mu, sigma)
+                    elif distribucion == "Exponencial":
+                        y = stats.expon.pdf(x, loc, scale)
+                    elif distribucion == "Uniforme":
+                        y = stats.uniform.pdf(x, a, b-a)
                 
-                if distribucion == "Normal":
-                    y = stats.norm.pdf(x, mu, sigma)
-                    ax.plot(x, y, 'r-', linewidth=2.5, label=f'Distribución {distribucion}')
-                elif distribucion == "Exponencial":
-                    y = stats.expon.pdf(x, loc, scale)
-                    ax.plot(x, y, 'r-', linewidth=2.5, label=f'Distribución {distribucion}')
-                elif distribucion == "Uniforme":
-                    y = stats.uniform.pdf(x, a, b-a)
-                    ax.plot(x, y, 'r-', linewidth=2.5, label=f'Distribución {distribucion}')
-                elif distribucion == "Poisson":
-                    x_discrete = np.arange(int(np.min(datos)), int(np.max(datos))+1)
-                    y_discrete = stats.poisson.pmf(x_discrete, lambd)
-                    ax.plot(x_discrete, y_discrete, 'ro-', linewidth=2, 
-                        markersize=6, label=f'Distribución {distribucion}')
+                if curva[0] is None:
+                    curva[0], = ax.plot([], [], 'r-', markersize=6)
+                curva[0].set_data(x, y)
+                curva[0].set_marker('o' if distribucion == "Poisson" else 'None')
+                curva[0].set_linewidth(2 if distribucion == "Poisson" else 2.5)
+                curva[0].set_label(f'Distribución {distribucion}')
+                ax.relim()
+                ax.autoscale_view()
                 
-                ax.set_xlabel('Valores', fontsize=11, fontweight='bold', color='#4b2e05')
-                ax.set_ylabel('Densidad de Probabilidad', fontsize=11, fontweight='bold', color='#4b2e05')
                 ax.set_title(f'Ajuste a Distribución {distribucion}\nK-S: {conclusion_ks} | χ²: {conclusion_chi}', 
                             fontsize=12, fontweight='bold', color='#4b2e05')
                 ax.legend(loc='best', facecolor='#f5deb3', edgecolor='#4b2e05', fontsize=10)
-                ax.grid(True, alpha=0.3, linestyle='--')
                 
                 if conclusion_ks == "AJUSTA" and conclusion_chi == "AJUSTA":
                     ax.set_facecolor('#e8f5e9')
-                elif conclusion_ks == "NO AJUSTA" and conclusion_chi == "NO AJUSTA":
+                elif conclusion_ks == "NO AJUSTA" and conclusion_chi in ("NO AJUSTA", "OMITIDA"):
                     ax.set_facecolor('#ffebee')
                 else:
                     ax.set_facecolor('#fff9c4')
                 
-                canvas_grafico.draw()
+                canvas_grafico.draw_idle()
                 
             except Exception as e:
+                if buf is not None:
+                    escribir_resultados("".join(buf))
                 messagebox.showerror("Error", f"Error al realizar la prueba:\n{str(e)}", parent=ventana)
-                import traceback
                 traceback.print_exc()
             
             ventana.lift()
@@ -1879,7 +2561,7 @@ Semilla usada:  {gen.semilla}"""
             Exporta los resultados de la prueba de ajuste a un archivo de texto
             y también guarda el gráfico como imagen PNG.
             """
-            if not resultados_text.get(1.0, tk.END).strip():
+            if not informe_actual[0].strip():
                 messagebox.showwarning("Advertencia", "No hay resultados para exportar", parent=ventana)
                 return
             
@@ -1894,20 +2576,18 @@ Semilla usada:  {gen.semilla}"""
                 try:
                     # Exportar resultados en texto
                     with open(archivo, 'w', encoding='utf-8') as f:
-                        f.write(resultados_text.get(1.0, tk.END))
+                        f.write(informe_actual[0])
                     
-                    # Exportar gráfico como imagen PNG
+                    # Exportar gráfico como imagen PNG en segundo plano
                     # Cambiar extensión de .txt a .png
                     archivo_grafico = archivo.replace('.txt', '.png')
-                    fig.savefig(archivo_grafico, dpi=300, bbox_inches='tight', facecolor='#6b4423')
-                    
-                    messagebox.showinfo(
+                    self._guardar_grafico(ventana, fig, archivo_grafico, lambda: messagebox.showinfo(
                         "Éxito", 
                         f"Resultados exportados correctamente:\n\n"
                         f"Texto: {archivo}\n"
                         f"Gráfico: {archivo_grafico}",
                         parent=ventana
-                    )
+                    ))
                 except Exception as e:
                     messagebox.showerror("Error", f"Error al exportar: {str(e)}", parent=ventana)
             
@@ -1917,7 +2597,7 @@ Semilla usada:  {gen.semilla}"""
                 font=("Segoe UI", 10, "bold"), bg="#4b2e05", fg="#f5deb3",
                 relief="flat", width=18, height=1, cursor='hand2').pack(side="left", padx=10)
 
-        tk.Button(botones_frame, text="Cerrar", command=on_close,
+        tk.Button(botones_frame, text="Cerrar", command=ventana.destroy,
                 font=("Segoe UI", 10, "bold"), bg="#e74c3c", fg="white",
                 relief="flat", width=12, height=1, cursor='hand2').pack(side="right", padx=10)
             
@@ -1956,39 +2636,10 @@ Semilla usada:  {gen.semilla}"""
         main_frame = tk.Frame(canvas, bg='#b8945f')
         main_frame_id = canvas.create_window((0, 0), window=main_frame, anchor="nw")
 
-        def actualizar_scroll(event=None):
-            """Actualiza el área scrolleable cuando cambia el tamaño del contenido."""
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(main_frame_id, width=canvas.winfo_width())
-
-        main_frame.bind("<Configure>", actualizar_scroll)
-        canvas.bind("<Configure>", actualizar_scroll)
+        self._ajustar_scroll(canvas, main_frame, main_frame_id)
 
-        def scroll_con_mouse(event):
-            """Permite scroll con rueda del mouse."""
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", scroll_con_mouse)
-        
-        def scroll_arriba(event):
-            """Scroll hacia arriba (Linux)."""
-            canvas.yview_scroll(-1, "units")
-        
-        def scroll_abajo(event):
-            """Scroll hacia abajo (Linux)."""
-            canvas.yview_scroll(1, "units")
-        
-        canvas.bind_all("<Button-4>", scroll_arriba)
-        canvas.bind_all("<Button-5>", scroll_abajo)
-        
-        def on_close():
-            """Limpia los bindings al cerrar la ventana."""
-            canvas.unbind_all("<MouseWheel>")
-            canvas.unbind_all("<Button-4>")
-            canvas.unbind_all("<Button-5>")
-            ventana.destroy()
-        
-        ventana.protocol("WM_DELETE_WINDOW", on_close)
+        # Scroll con rueda del mouse (Windows y Linux)
+        self._vincular_rueda(ventana, canvas)
 
         tk.Label(main_frame, text="Simulaciones Monte Carlo",
                 font=("Segoe UI", 24, "bold"), bg='#4b2e05', fg='#d4a574').pack(pady=10)
@@ -2073,9 +2724,50 @@ Semilla usada:  {gen.semilla}"""
 
         fig = Figure(figsize=(7, 5), dpi=100, facecolor='#6b4423')
         ax = fig.add_subplot(111, facecolor='#d4a574')
+        ax.tick_params(colors='#4b2e05')
+        ax.grid(True, alpha=0.3)
         canvas_grafico = FigureCanvasTkAgg(fig, grafico_frame)
         canvas_grafico.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
 
+        # (fondo, ticks, rejilla) de cada estilo; π usa uno propio más claro
+        estilos_ejes = {'cafe': ('#d4a574', '#4b2e05', plt.rcParams['grid.color']),
+                        'pi': ('#f8f9fa', '#2c3e50', '#95a5a6')}
+        estilo_actual = ['cafe']  # estilo aplicado ahora a los ejes
+
+        def preparar_ejes(estilo='cafe', conservar=None):
+            """Quita los datos del gráfico anterior y cambia el estilo solo si hace falta."""
+            _limpiar_datos_ejes(ax, conservar)
+            if estilo_actual[0] != estilo:
+                fondo, texto, rejilla = estilos_ejes[estilo]
+                ax.set_facecolor(fondo)
+                ax.tick_params(colors=texto)
+                ax.grid(True, alpha=0.3, color=rejilla)
+                estilo_actual[0] = estilo
+
+        barras_hist = [None]  # BarContainer del último histograma, mientras siga en los ejes
+
+        def dibujar_histograma(conteos, bordes):
+            """
+            Dibuja un histograma ya calculado con np.histogram.
+
+            Las frecuencias se calculan en el hilo de la simulación; aquí solo
+            se dibujan. Si las barras del histograma anterior siguen en los
+            ejes solo se mueven y cambian de alto, en lugar de crear
+            rectángulos nuevos.
+            """
+            anchos = np.diff(bordes)
+            barras = barras_hist[0]
+            if barras is not None and barras.patches[0].axes is ax:
+                for rect, x, w, h in zip(barras, bordes[:-1].tolist(), anchos.tolist(), conteos.tolist()):
+                    rect.set_x(x)
+                    rect.set_width(w)
+                    rect.set_height(h)
+                ax.relim()
+                ax.autoscale_view()
+            else:
+                barras_hist[0] = ax.bar(bordes[:-1], conteos, width=anchos, align='edge',
+                                        color='#8b6914', edgecolor='#4b2e05', alpha=0.7)
+
         # Resultados texto
         texto_frame = tk.LabelFrame(resultados_frame, text="Resultados",
                                 font=("Segoe UI", 11, "bold"),
@@ -2091,6 +2783,50 @@ Semilla usada:  {gen.semilla}"""
         resultados_actuales = {'titulo': '', 'datos': ''}
 
         # -------------------- Funciones de Simulación --------------------
+        # Un generador por ventana, compartido por todas las simulaciones; solo
+        # lo usa el único hilo del ejecutor, y cada simulación toma de una vez
+        # los uniformes que necesita
+        gen = GeneradorAleatorios()
+        artistas_pi = [None]  # scatter del último gráfico de π, mientras siga en los ejes
+        buffers = {'muestras': None, 'medias': None}  # arreglos reutilizados entre corridas
+        espera = [None]  # id del after que revisa la simulación en curso
+
+        def cancelar_espera(event):
+            # Al cerrar la ventana con una simulación en curso, la revisión
+            # pendiente quedaría apuntando a un comando de Tk ya eliminado
+            if event.widget is ventana and espera[0] is not None:
+                ventana.after_cancel(espera[0])
+                espera[0] = None
+
+        ventana.bind("<Destroy>", cancelar_espera, add="+")
+
+        def en_segundo_plano(calcular, mostrar):
+            """
+            Corre `calcular` en el ejecutor de la aplicación y, al terminar,
+            entrega su resultado a `mostrar` en el hilo de Tk.
+
+            Mientras tanto la ventana sigue respondiendo y el botón de
+            ejecutar queda deshabilitado, de modo que nunca hay dos
+            simulaciones usando el generador a la vez.
+            """
+            btn_ejecutar.config(state='disabled', text="Simulando...")
+            futuro = self.ejecutor.submit(calcular)
+
+            def esperar():
+                espera[0] = None
+                if not ventana.winfo_exists():
+                    return
+                if not futuro.done():
+                    espera[0] = ventana.after(50, esperar)
+                    return
+                btn_ejecutar.config(state='normal', text="Ejecutar Simulación")
+                try:
+                    mostrar(futuro.result())
+                except Exception as e:
+                    messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
+
+            espera[0] = ventana.after(50, esperar)
+
         def simular_pi():
             """Estima π usando método de Monte Carlo (círculo en cuadrado)."""
             try:
@@ -2099,58 +2835,64 @@ Semilla usada:  {gen.semilla}"""
                     messagebox.showerror("Error", "Ingrese N entre 1 y 2,000,000", parent=ventana)
                     return
 
-                gen = GeneradorAleatorios()
-                xs_dentro, ys_dentro = [], []
-                xs_fuera, ys_fuera = [], []
-                dentro = 0
-
-                for i in range(N):
-                    x = gen.lcg()
-                    y = gen.lcg()
-                    if (x - 0.5)**2 + (y - 0.5)**2 <= 0.25:
-                        xs_dentro.append(x)
-                        ys_dentro.append(y)
-                        dentro += 1
+                def calcular():
+                    # Pares (x, y) en el mismo orden en que los daría lcg()
+                    puntos = gen.uniforme(n=2 * N).reshape(N, 2)
+                    mascara = (puntos[:, 0] - 0.5)**2 + (puntos[:, 1] - 0.5)**2 <= 0.25
+                    # Solo se grafican los primeros puntos, que ya son una muestra
+                    # uniforme. Un solo scatter; el color RGBA de cada punto se toma
+                    # de una paleta de dos entradas indexada con la máscara
+                    visibles = min(N, PI_PUNTOS_GRAFICO)
+                    return (puntos[:visibles].copy(), COLORES_PI[mascara[:visibles].view(np.uint8)],
+                            int(np.count_nonzero(mascara)))
+
+                def mostrar(resultado):
+                    puntos, colores, dentro = resultado
+                    pi_est = 4 * (dentro / N)
+                    error = abs(pi_est - np.pi)
+                    porcentaje_error = (error / np.pi) * 100
+
+                    dispersion = artistas_pi[0]
+                    if dispersion is not None and dispersion.axes is ax:
+                        # El gráfico de π sigue en pantalla: solo se cambian los puntos
+                        dispersion.set_offsets(puntos)
+                        dispersion.set_facecolors(colores)
                     else:
-                        xs_fuera.append(x)
-                        ys_fuera.append(y)
-
-                pi_est = 4 * (dentro / N)
-                error = abs(pi_est - np.pi)
-                porcentaje_error = (error / np.pi) * 100
-
-                ax.clear()
-                ax.set_xlim(0, 1)
-                ax.set_ylim(0, 1)
-                ax.set_aspect('equal', 'box')
-
-                circulo = plt.Circle((0.5, 0.5), 0.5, fill=False, edgecolor='#2c3e50', linewidth=2.5)
-                ax.add_patch(circulo)
-
-                ax.scatter(xs_dentro, ys_dentro, s=2, color='#27ae60', alpha=0.7, label=f'Dentro ({dentro})')
-                ax.scatter(xs_fuera, ys_fuera, s=2, color='#e74c3c', alpha=0.7, label=f'Fuera ({N-dentro})')
-                ax.set_title(f'Estimación de π = {pi_est:.6f}', color='#2c3e50', fontweight='bold', fontsize=12)
-                ax.legend(facecolor='#ecf0f1', edgecolor='#2c3e50', labelcolor='#2c3e50')
-                ax.tick_params(colors='#2c3e50')
-                ax.grid(True, alpha=0.3, color='#95a5a6')
-                ax.set_facecolor('#f8f9fa')
-
-                resultados_text.delete(1.0, tk.END)
-                resultado_str = f"ESTIMACIÓN DE π\n"
-                resultado_str += f"{'='*33}\n\n"
-                resultado_str += f"π estimado:    {pi_est:.6f}\n"
-                resultado_str += f"π real:        {np.pi:.6f}\n"
-                resultado_str += f"Error:         {error:.6f}\n"
-                resultado_str += f"Error %:       {porcentaje_error:.4f}%\n"
-                resultado_str += f"Puntos dentro: {dentro}\n"
-                resultado_str += f"Puntos fuera:  {N-dentro}\n"
-                resultado_str += f"Total puntos:  {N}\n"
-                
-                resultados_text.insert(tk.END, resultado_str)
-                resultados_actuales['titulo'] = 'Estimación de π'
-                resultados_actuales['datos'] = resultado_str
-
-                canvas_grafico.draw()
+                        preparar_ejes('pi')
+                        ax.set_xlim(0, 1)
+                        ax.set_ylim(0, 1)
+                        ax.set_aspect('equal', 'box')
+                        ax.set_xlabel('')
+                        ax.set_ylabel('')
+
+                        circulo = plt.Circle((0.5, 0.5), 0.5, fill=False, edgecolor='#2c3e50', linewidth=2.5)
+                        ax.add_patch(circulo)
+                        artistas_pi[0] = ax.scatter(puntos[:, 0], puntos[:, 1], s=2, c=colores, alpha=0.7)
+                    ax.set_title(f'Estimación de π = {pi_est:.6f}', color='#2c3e50', fontweight='bold', fontsize=12)
+                    ax.legend(handles=[Patch(color=COLORES_PI[1], alpha=0.7, label=f'Dentro ({dentro})'),
+                                       Patch(color=COLORES_PI[0], alpha=0.7, label=f'Fuera ({N-dentro})')],
+                              facecolor='#ecf0f1', edgecolor='#2c3e50', labelcolor='#2c3e50')
+
+                    resultados_text.delete(1.0, tk.END)
+                    resultado_str = f"""ESTIMACIÓN DE π
+{'='*33}
+
+π estimado:    {pi_est:.6f}
+π real:        {np.pi:.6f}
+Error:         {error:.6f}
+Error %:       {porcentaje_error:.4f}%
+Puntos dentro: {dentro}
+Puntos fuera:  {N-dentro}
+Total puntos:  {N}
+"""
+
+                    resultados_text.insert(tk.END, resultado_str)
+                    resultados_actuales['titulo'] = 'Estimación de π'
+                    resultados_actuales['datos'] = resultado_str
+
+                    canvas_grafico.draw_idle()
+
+                en_segundo_plano(calcular, mostrar)
             except Exception as e:
                 messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
 
@@ -2165,67 +2907,74 @@ Semilla usada:  {gen.semilla}"""
                 prob_ganar = float(config_entries['Probabilidad de ganar'].get())
                 sims = int(config_entries['Simulaciones'].get())
 
-                gen = GeneradorAleatorios()
-                capitales_finales = []
-                rondas_totales = []
-                capital_por_ronda = []
-
-                for _ in range(sims):
-                    cap = capital
-                    rondas = 0
-                    capital_ronda = [cap]
-                    
-                    while cap > 0 and rondas < 10000:
-                        if gen.lcg() < prob_ganar:
-                            cap += apuesta
-                        else:
-                            cap -= apuesta
-                        rondas += 1
-                        capital_ronda.append(cap)
-                    
-                    capitales_finales.append(cap)
-                    rondas_totales.append(rondas)
-                    capital_por_ronda.append(capital_ronda)
-
-                # Visualización: mostrar evolución de 5 simulaciones
-                ax.clear()
-                for i in range(min(5, len(capital_por_ronda))):
-                    ax.plot(capital_por_ronda[i], linewidth=1.5, alpha=0.7, label=f'Jugador {i+1}')
-                
-                ax.axhline(y=0, color='red', linestyle='--', linewidth=2, label='Ruina')
-                ax.set_xlabel('Ronda', color='#4b2e05', fontweight='bold')
-                ax.set_ylabel('Capital ($)', color='#4b2e05', fontweight='bold')
-                ax.set_title('Evolución del Capital - Ruina del Jugador', color='#4b2e05', fontweight='bold')
-                ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05', fontsize=8)
-                ax.tick_params(colors='#4b2e05')
-                ax.grid(True, alpha=0.3)
-                ax.set_facecolor('#d4a574')
-
-                ruinas = sum(1 for c in capitales_finales if c == 0)
-                prob_ruina = ruinas / sims
-
-                resultados_text.delete(1.0, tk.END)
-                resultado_str = f"RUINA DEL JUGADOR\n"
-                resultado_str += f"{'='*33}\n\n"
-                resultado_str += f"Capital inicial:     ${capital}\n"
-                resultado_str += f"Apuesta/ronda:       ${apuesta}\n"
-                resultado_str += f"P(ganar):            {prob_ganar:.4f}\n"
-                resultado_str += f"Simulaciones:        {sims}\n\n"
-                resultado_str += f"Pasos de simulación:\n"
-                resultado_str += f"1. Se generan {sims} jugadores\n"
-                resultado_str += f"2. Cada jugador juega hasta arruinarse\n"
-                resultado_str += f"3. Se registra capital y rondas\n\n"
-                resultado_str += f"Jugadores arruinados: {ruinas}\n"
-                resultado_str += f"Probabilidad ruina:  {prob_ruina:.4f}\n"
-                resultado_str += f"Capital promedio:    ${np.mean(capitales_finales):.2f}\n"
-                resultado_str += f"Capital máximo:      ${np.max(capitales_finales)}\n"
-                resultado_str += f"Rondas promedio:     {np.mean(rondas_totales):.0f}\n"
-                
-                resultados_text.insert(tk.END, resultado_str)
-                resultados_actuales['titulo'] = 'Ruina del Jugador'
-                resultados_actuales['datos'] = resultado_str
+                def calcular():
+                    capitales_finales = np.empty(sims, dtype=np.int64)
+                    rondas_totales = np.empty(sims, dtype=np.int64)
+                    # Solo se guardan completas las trayectorias que se grafican, en
+                    # int32 cuando el capital no puede salirse de ese rango
+                    limite = abs(capital) + abs(apuesta) * RUINA_MAX_RONDAS
+                    tipo = np.int32 if limite <= np.iinfo(np.int32).max else np.int64
+                    capital_por_ronda = np.empty((min(RUINA_TRAYECTORIAS, sims), RUINA_MAX_RONDAS + 1),
+                                                 dtype=tipo)
+                    capital_por_ronda[:, 0] = capital
+                    estado = np.array([0, capital, 0], dtype=np.int64)
+
+                    # Sin Numba, cada jugador avanza por tramos vectorizados
+                    avanzar = _ruina_kernel if NUMBA_DISPONIBLE else _ruina_vectorizada
+                    while not avanzar(gen.uniforme(n=BLOQUE_LCG), capital, apuesta, prob_ganar, estado,
+                                      capitales_finales, rondas_totales, capital_por_ronda):
+                        pass
 
-                canvas_grafico.draw()
+                    # Una reducción en C por estadístico sobre los arreglos int64
+                    ruinas = int(np.count_nonzero(capitales_finales == 0))
+                    return (capital_por_ronda, rondas_totales[:len(capital_por_ronda)], ruinas,
+                            capitales_finales.mean(), int(capitales_finales.max()), rondas_totales.mean())
+
+                def mostrar(resultado):
+                    (capital_por_ronda, rondas_graficadas, ruinas,
+                     capital_promedio, capital_maximo, rondas_promedio) = resultado
+                    prob_ruina = ruinas / sims
+
+                    # Visualización: mostrar evolución de las primeras simulaciones
+                    preparar_ejes()
+                    for i in range(len(capital_por_ronda)):
+                        ax.plot(capital_por_ronda[i, :rondas_graficadas[i] + 1], linewidth=1.5, alpha=0.7,
+                                label=f'Jugador {i+1}')
+
+                    ax.axhline(y=0, color='red', linestyle='--', linewidth=2, label='Ruina')
+                    ax.set_xlabel('Ronda', color='#4b2e05', fontweight='bold')
+                    ax.set_ylabel('Capital ($)', color='#4b2e05', fontweight='bold')
+                    ax.set_title('Evolución del Capital - Ruina del Jugador', color='#4b2e05', fontweight='bold')
+                    ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05', fontsize=8)
+
+                    resultados_text.delete(1.0, tk.END)
+                    resultado_str = f"""RUINA DEL JUGADOR
+{'='*33}
+
+Capital inicial:     ${capital}
+Apuesta/ronda:       ${apuesta}
+P(ganar):            {prob_ganar:.4f}
+Simulaciones:        {sims}
+
+Pasos de simulación:
+1. Se generan {sims} jugadores
+2. Cada jugador juega hasta arruinarse
+3. Se registra capital y rondas
+
+Jugadores arruinados: {ruinas}
+Probabilidad ruina:  {prob_ruina:.4f}
+Capital promedio:    ${capital_promedio:.2f}
+Capital máximo:      ${capital_maximo}
+Rondas promedio:     {rondas_promedio:.0f}
+"""
+
+                    resultados_text.insert(tk.END, resultado_str)
+                    resultados_actuales['titulo'] = 'Ruina del Jugador'
+                    resultados_actuales['datos'] = resultado_str
+
+                    canvas_grafico.draw_idle()
+
+                en_segundo_plano(calcular, mostrar)
             except Exception as e:
                 messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
 
@@ -2236,56 +2985,63 @@ Semilla usada:  {gen.semilla}"""
                 tiempo_servicio = float(config_entries['Tiempo servicio promedio (min)'].get())
                 sims = int(config_entries['Simulaciones'].get())
 
-                gen = GeneradorAleatorios()
-                tiempos_espera = []
-                largos_cola = []
-
-                for _ in range(sims):
-                    tiempo_llegada = 60 / clientes_hora
-                    cola = []
-                    tiempo_actual = 0
-                    tiempos_espera_sim = []
-
-                    for i in range(clientes_hora):
-                        tiempo_actual += tiempo_llegada + gen.lcg() * 2
-                        inicio_espera = max(tiempo_actual, cola[-1] if cola else 0)
-                        tiempo_espera = max(0, inicio_espera - tiempo_actual)
-                        tiempos_espera_sim.append(tiempo_espera)
-                        cola.append(inicio_espera + tiempo_servicio)
-
-                    tiempos_espera.extend(tiempos_espera_sim)
-                    largos_cola.append(len(cola))
-
-                ax.clear()
-                ax.hist(tiempos_espera, bins=40, color='#8b6914', edgecolor='#4b2e05', alpha=0.7)
-                ax.set_xlabel('Tiempo de Espera (min)', color='#4b2e05', fontweight='bold')
-                ax.set_ylabel('Frecuencia', color='#4b2e05', fontweight='bold')
-                ax.set_title('Distribución de Tiempos de Espera', color='#4b2e05', fontweight='bold')
-                ax.tick_params(colors='#4b2e05')
-                ax.grid(True, alpha=0.3)
-                ax.set_facecolor('#d4a574')
-
-                resultados_text.delete(1.0, tk.END)
-                resultado_str = f"SISTEMA DE COLAS M/M/1\n"
-                resultado_str += f"{'='*33}\n\n"
-                resultado_str += f"Clientes/hora:       {clientes_hora}\n"
-                resultado_str += f"Tiempo servicio:     {tiempo_servicio:.2f} min\n"
-                resultado_str += f"Simulaciones:        {sims}\n\n"
-                resultado_str += f"Pasos de simulación:\n"
-                resultado_str += f"1. Generar llegadas de clientes\n"
-                resultado_str += f"2. Calcular tiempo en cola\n"
-                resultado_str += f"3. Simular tiempo de servicio\n\n"
-                resultado_str += f"Tiempo esp. promedio: {np.mean(tiempos_espera):.2f} min\n"
-                resultado_str += f"Tiempo esp. máximo:  {np.max(tiempos_espera):.2f} min\n"
-                resultado_str += f"Percentil 90%:       {np.percentile(tiempos_espera, 90):.2f} min\n"
-                resultado_str += f"Largo cola promedio: {np.mean(largos_cola):.2f}\n"
-                resultado_str += f"Tasa utilización:    {(clientes_hora*tiempo_servicio)/60:.2%}\n"
-                
-                resultados_text.insert(tk.END, resultado_str)
-                resultados_actuales['titulo'] = 'Sistema de Colas'
-                resultados_actuales['datos'] = resultado_str
-
-                canvas_grafico.draw()
+                tiempo_llegada = 60 / clientes_hora
+
+                def calcular():
+                    # Llegadas de todas las simulaciones, una fila por simulación
+                    llegadas = gen.uniforme(n=sims * clientes_hora).reshape(sims, clientes_hora)
+                    llegadas *= 2
+                    llegadas += tiempo_llegada
+                    np.cumsum(llegadas, axis=1, out=llegadas)
+
+                    # Con servicio constante s, la recursión inicio_i = max(a_i, inicio_{i-1} + s)
+                    # tiene forma cerrada inicio_i = i·s + max_{j≤i}(a_j - j·s)
+                    pasos_servicio = np.arange(clientes_hora) * tiempo_servicio
+                    inicios = np.maximum.accumulate(llegadas - pasos_servicio, axis=1)
+                    inicios += pasos_servicio
+                    tiempos_espera = np.maximum(inicios - llegadas, 0).ravel()
+
+                    # Al hilo de Tk solo llegan las frecuencias y los resúmenes
+                    return (np.histogram(tiempos_espera, bins=CLASES_MONTE_CARLO),
+                            tiempos_espera.mean(), tiempos_espera.max(), np.percentile(tiempos_espera, 90))
+
+                def mostrar(resultado):
+                    histograma, espera_promedio, espera_maxima, percentil_90 = resultado
+                    largos_cola = np.full(sims, clientes_hora)
+
+                    preparar_ejes(conservar=barras_hist[0])
+                    dibujar_histograma(*histograma)
+                    ax.set_xlabel('Tiempo de Espera (min)', color='#4b2e05', fontweight='bold')
+                    ax.set_ylabel('Frecuencia', color='#4b2e05', fontweight='bold')
+                    ax.set_title('Distribución de Tiempos de Espera', color='#4b2e05', fontweight='bold')
+
+                    resultados_text.delete(1.0, tk.END)
+                    resultado_str = f"""SISTEMA DE COLAS M/M/1
+{'='*33}
+
+Clientes/hora:       {clientes_hora}
+Tiempo servicio:     {tiempo_servicio:.2f} min
+Simulaciones:        {sims}
+
+Pasos de simulación:
+1. Generar llegadas de clientes
+2. Calcular tiempo en cola
+3. Simular tiempo de servicio
+
+Tiempo esp. promedio: {espera_promedio:.2f} min
+Tiempo esp. máximo:  {espera_maxima:.2f} min
+Percentil 90%:       {percentil_90:.2f} min
+Largo cola promedio: {np.mean(largos_cola):.2f}
+Tasa utilización:    {(clientes_hora*tiempo_servicio)/60:.2%}
+"""
+
+                    resultados_text.insert(tk.END, resultado_str)
+                    resultados_actuales['titulo'] = 'Sistema de Colas'
+                    resultados_actuales['datos'] = resultado_str
+
+                    canvas_grafico.draw_idle()
+
+                en_segundo_plano(calcular, mostrar)
             except Exception as e:
                 messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
 
@@ -2295,62 +3051,66 @@ Semilla usada:  {gen.semilla}"""
                 N = int(config_entries['Número de puntos'].get())
                 funcion_str = config_entries['Función'].get()
 
-                gen = GeneradorAleatorios()
-                dentro = 0
-
-                for i in range(N):
-                    x = gen.lcg()
-                    y = gen.lcg()
-                    try:
-                        y_func = eval(funcion_str, {"x": x, "np": np})
-                        if y <= y_func:
-                            dentro += 1
-                    except:
-                        pass
+                # La expresión se compila una vez por texto y se evalúa sobre arreglos
+                codigo = _compilar_integrando(funcion_str)
 
-                area_est = dentro / N
-
-                x_plot = np.linspace(0, 1, 1000)
-                y_plot = []
-                for x_val in x_plot:
+                def evaluar(x):
+                    """Evalúa la función en todos los valores del arreglo x."""
                     try:
-                        y_val = eval(funcion_str, {"x": x_val, "np": np})
-                        y_plot.append(y_val)
-                    except:
-                        y_plot.append(0)
-
-                ax.clear()
-                ax.plot(x_plot, y_plot, 'r-', linewidth=2, label=f'y = {funcion_str}')
-                ax.fill_between(x_plot, 0, y_plot, alpha=0.3, color='#d4a574')
-                ax.set_xlim(0, 1)
-                ax.set_ylim(0, 1)
-                ax.set_xlabel('x', color='#4b2e05', fontweight='bold')
-                ax.set_ylabel('y', color='#4b2e05', fontweight='bold')
-                ax.set_title(f'Integral: ∫y={funcion_str}dx', color='#4b2e05', fontweight='bold')
-                ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05')
-                ax.tick_params(colors='#4b2e05')
-                ax.grid(True, alpha=0.3)
-                ax.set_facecolor('#d4a574')
-
-                resultados_text.delete(1.0, tk.END)
-                resultado_str = f"INTEGRACIÓN POR MONTE CARLO\n"
-                resultado_str += f"{'='*33}\n\n"
-                resultado_str += f"Función: ∫y={funcion_str}dx\n"
-                resultado_str += f"Límites: [0, 1]\n"
-                resultado_str += f"Puntos: {N}\n\n"
-                resultado_str += f"Pasos de simulación:\n"
-                resultado_str += f"1. Generar puntos aleatorios\n"
-                resultado_str += f"2. Contar puntos bajo la curva\n"
-                resultado_str += f"3. Estimar área\n\n"
-                resultado_str += f"Área estimada:  {area_est:.6f}\n"
-                resultado_str += f"Puntos dentro:  {dentro}\n"
-                resultado_str += f"Puntos fuera:   {N-dentro}\n"
-                
-                resultados_text.insert(tk.END, resultado_str)
-                resultados_actuales['titulo'] = 'Integral Definida'
-                resultados_actuales['datos'] = resultado_str
-
-                canvas_grafico.draw()
+                        y = eval(codigo, {"x": x, "np": np})
+                    except (TypeError, ValueError):
+                        # La expresión no admite arreglos (p. ej. usa max): valor por valor
+                        return np.fromiter((eval(codigo, {"x": v, "np": np}) for v in x.tolist()),
+                                           dtype=np.float64, count=x.size)
+                    return np.broadcast_to(np.asarray(y, dtype=np.float64), x.shape)
+
+                def calcular():
+                    # Pares (x, y) en el mismo orden en que los daría lcg()
+                    puntos = gen.uniforme(n=2 * N).reshape(N, 2)
+                    dentro = int(np.count_nonzero(puntos[:, 1] <= evaluar(puntos[:, 0])))
+
+                    x_plot = np.linspace(0, 1, 1000)
+                    return dentro, x_plot, evaluar(x_plot)
+
+                def mostrar(resultado):
+                    dentro, x_plot, y_plot = resultado
+                    area_est = dentro / N
+
+                    preparar_ejes()
+                    ax.plot(x_plot, y_plot, 'r-', linewidth=2, label=f'y = {funcion_str}')
+                    ax.fill_between(x_plot, 0, y_plot, alpha=0.3, color='#d4a574')
+                    ax.set_xlim(0, 1)
+                    ax.set_ylim(0, 1)
+                    ax.set_xlabel('x', color='#4b2e05', fontweight='bold')
+                    ax.set_ylabel('y', color='#4b2e05', fontweight='bold')
+                    ax.set_title(f'Integral: ∫y={funcion_str}dx', color='#4b2e05', fontweight='bold')
+                    ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05')
+
+                    resultados_text.delete(1.0, tk.END)
+                    resultado_str = f"""INTEGRACIÓN POR MONTE CARLO
+{'='*33}
+
+Función: ∫y={funcion_str}dx
+Límites: [0, 1]
+Puntos: {N}
+
+Pasos de simulación:
+1. Generar puntos aleatorios
+2. Contar puntos bajo la curva
+3. Estimar área
+
+Área estimada:  {area_est:.6f}
+Puntos dentro:  {dentro}
+Puntos fuera:   {N-dentro}
+"""
+
+                    resultados_text.insert(tk.END, resultado_str)
+                    resultados_actuales['titulo'] = 'Integral Definida'
+                    resultados_actuales['datos'] = resultado_str
+
+                    canvas_grafico.draw_idle()
+
+                en_segundo_plano(calcular, mostrar)
             except Exception as e:
                 messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
 
@@ -2362,56 +3122,58 @@ Semilla usada:  {gen.semilla}"""
                 costo_ord = float(config_entries['Costo ordenar'].get())
                 sims = int(config_entries['Simulaciones'].get())
 
-                gen = GeneradorAleatorios()
-                costos_totales = []
-                cantidades_opt = []
-
-                for q in range(10, 200, 10):
-                    costos_sim = []
-                    for _ in range(sims):
-                        demanda_sim = demanda + int(gen.lcg() * 40 - 20)
-                        if q >= demanda_sim:
-                            costo = (q / 2) * costo_unit + costo_ord
-                        else:
-                            costo = (q / 2) * costo_unit + (demanda_sim - q) * costo_unit * 2 + costo_ord
-                        costos_sim.append(costo)
-                    costos_totales.append(np.mean(costos_sim))
-                    cantidades_opt.append(q)
-
-                q_optimo = cantidades_opt[np.argmin(costos_totales)]
-
-                ax.clear()
-                ax.plot(cantidades_opt, costos_totales, 'o-', color='#8b6914', linewidth=2, markersize=6)
-                ax.axvline(q_optimo, color='#e74c3c', linestyle='--', linewidth=2, label=f'Q óptimo: {q_optimo}')
-                ax.set_xlabel('Cantidad a Ordenar (Q)', color='#4b2e05', fontweight='bold')
-                ax.set_ylabel('Costo Total Promedio ($)', color='#4b2e05', fontweight='bold')
-                ax.set_title('Análisis de Costo - Problema de Inventarios', color='#4b2e05', fontweight='bold')
-                ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05')
-                ax.tick_params(colors='#4b2e05')
-                ax.grid(True, alpha=0.3)
-                ax.set_facecolor('#d4a574')
-
-                resultados_text.delete(1.0, tk.END)
-                resultado_str = f"PROBLEMA DE INVENTARIOS\n"
-                resultado_str += f"{'='*33}\n\n"
-                resultado_str += f"Demanda promedio:    {demanda} unid/período\n"
-                resultado_str += f"Costo unitario:      ${costo_unit:.2f}\n"
-                resultado_str += f"Costo de orden:      ${costo_ord:.2f}\n"
-                resultado_str += f"Simulaciones:        {sims}\n\n"
-                resultado_str += f"Pasos de simulación:\n"
-                resultado_str += f"1. Variar cantidad de orden\n"
-                resultado_str += f"2. Simular demanda aleatoria\n"
-                resultado_str += f"3. Calcular costo total\n"
-                resultado_str += f"4. Encontrar Q óptima\n\n"
-                resultado_str += f"Cantidad óptima (Q): {q_optimo} unid\n"
-                resultado_str += f"Costo mínimo:        ${min(costos_totales):.2f}\n"
-                resultado_str += f"Rango Q evaluado:    {min(cantidades_opt)}-{max(cantidades_opt)} unid\n"
-                
-                resultados_text.insert(tk.END, resultado_str)
-                resultados_actuales['titulo'] = 'Problema de Inventarios'
-                resultados_actuales['datos'] = resultado_str
-
-                canvas_grafico.draw()
+                cantidades_opt = np.arange(10, 200, 10)
+
+                def calcular():
+                    # Una fila de demandas simuladas por cada Q (astype trunca hacia
+                    # cero, igual que int()); los costos se calculan por difusión
+                    demandas = demanda + (gen.uniforme(n=cantidades_opt.size * sims) * 40 - 20).astype(np.int64)
+                    demandas = demandas.reshape(cantidades_opt.size, sims)
+                    q = cantidades_opt[:, None]
+                    faltante = np.maximum(demandas - q, 0)
+                    costos = (q / 2) * costo_unit + faltante * (costo_unit * 2) + costo_ord
+                    return costos.mean(axis=1)
+
+                def mostrar(costos_totales):
+                    indice_optimo = int(costos_totales.argmin())
+                    costo_minimo = float(costos_totales[indice_optimo])
+                    q_optimo = int(cantidades_opt[indice_optimo])
+
+                    preparar_ejes()
+                    ax.plot(cantidades_opt, costos_totales, 'o-', color='#8b6914', linewidth=2, markersize=6)
+                    ax.axvline(q_optimo, color='#e74c3c', linestyle='--', linewidth=2, label=f'Q óptimo: {q_optimo}')
+                    ax.set_xlabel('Cantidad a Ordenar (Q)', color='#4b2e05', fontweight='bold')
+                    ax.set_ylabel('Costo Total Promedio ($)', color='#4b2e05', fontweight='bold')
+                    ax.set_title('Análisis de Costo - Problema de Inventarios', color='#4b2e05', fontweight='bold')
+                    ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05')
+
+                    resultados_text.delete(1.0, tk.END)
+                    resultado_str = f"""PROBLEMA DE INVENTARIOS
+{'='*33}
+
+Demanda promedio:    {demanda} unid/período
+Costo unitario:      ${costo_unit:.2f}
+Costo de orden:      ${costo_ord:.2f}
+Simulaciones:        {sims}
+
+Pasos de simulación:
+1. Variar cantidad de orden
+2. Simular demanda aleatoria
+3. Calcular costo total
+4. Encontrar Q óptima
+
+Cantidad óptima (Q): {q_optimo} unid
+Costo mínimo:        ${costo_minimo:.2f}
+Rango Q evaluado:    {cantidades_opt[0]}-{cantidades_opt[-1]} unid
+"""
+
+                    resultados_text.insert(tk.END, resultado_str)
+                    resultados_actuales['titulo'] = 'Problema de Inventarios'
+                    resultados_actuales['datos'] = resultado_str
+
+                    canvas_grafico.draw_idle()
+
+                en_segundo_plano(calcular, mostrar)
             except Exception as e:
                 messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
 
@@ -2427,79 +3189,91 @@ Semilla usada:  {gen.semilla}"""
                 sims = int(config_entries['Simulaciones'].get())
                 alpha = float(config_entries['Nivel significancia (α)'].get())
 
-                gen = GeneradorAleatorios()
-                medias_muestra = []
-                rechazos = 0
-
-                for _ in range(sims):
-                    muestra = []
-                    for _ in range(n):
-                        # Generar N(μ₀, σ²)
-                        u1 = gen.lcg()
-                        u2 = gen.lcg()
-                        z = np.sqrt(-2 * np.log(u1)) * np.cos(2 * np.pi * u2)
-                        x = mu_0 + sigma * z
-                        muestra.append(x)
-                    
-                    media = np.mean(muestra)
-                    medias_muestra.append(media)
-                    
-                    # Test: ¿rechazamos H0?
-                    se = sigma / np.sqrt(n)
-                    z_stat = (media - mu_0) / se
-                    p_value = 2 * (1 - stats.norm.cdf(abs(z_stat)))
-                    
-                    if p_value < alpha:
-                        rechazos += 1
-
-                from scipy import stats as sp_stats
-                
-                ax.clear()
-                ax.hist(medias_muestra, bins=40, color='#8b6914', edgecolor='#4b2e05', alpha=0.7, density=True)
-                
-                x_range = np.linspace(min(medias_muestra), max(medias_muestra), 100)
                 se = sigma / np.sqrt(n)
-                pdf = sp_stats.norm.pdf(x_range, mu_0, se)
-                ax.plot(x_range, pdf, 'r-', linewidth=2, label='N(μ₀, SE²)')
-                ax.axvline(mu_0, color='green', linestyle='--', linewidth=2, label=f'μ₀ = {mu_0}')
-                ax.set_xlabel('Media Muestral', color='#4b2e05', fontweight='bold')
-                ax.set_ylabel('Densidad', color='#4b2e05', fontweight='bold')
-                ax.set_title('Prueba de Hipótesis - Distribución de Medias Muestrales', color='#4b2e05', fontweight='bold')
-                ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05')
-                ax.tick_params(colors='#4b2e05')
-                ax.grid(True, alpha=0.3)
-                ax.set_facecolor('#d4a574')
-
-                potencia = rechazos / sims
-                
-                resultados_text.delete(1.0, tk.END)
-                resultado_str = f"PRUEBA DE HIPÓTESIS - MONTE CARLO\n"
-                resultado_str += f"{'='*33}\n\n"
-                resultado_str += f"H₀: μ = {mu_0}\n"
-                resultado_str += f"H₁: μ ≠ {mu_0}\n"
-                resultado_str += f"Nivel significancia: {alpha}\n\n"
-                resultado_str += f"Parámetros:\n"
-                resultado_str += f"- Desv. estándar:    {sigma}\n"
-                resultado_str += f"- Tamaño muestra:    {n}\n"
-                resultado_str += f"- Simulaciones:      {sims}\n\n"
-                resultado_str += f"Pasos de simulación:\n"
-                resultado_str += f"1. Generar {sims} muestras N({mu_0}, {sigma}²)\n"
-                resultado_str += f"2. Calcular media de cada muestra\n"
-                resultado_str += f"3. Realizar test Z para cada muestra\n"
-                resultado_str += f"4. Contar rechazos de H₀\n\n"
-                resultado_str += f"Resultados:\n"
-                resultado_str += f"Media de medias:     {np.mean(medias_muestra):.4f}\n"
-                resultado_str += f"Error estándar:      {se:.4f}\n"
-                resultado_str += f"Rechazos H₀:         {rechazos}\n"
-                resultado_str += f"Potencia (tipo II):  {potencia:.4f}\n"
-                resultado_str += f"Min media:           {np.min(medias_muestra):.4f}\n"
-                resultado_str += f"Max media:           {np.max(medias_muestra):.4f}\n"
-                
-                resultados_text.insert(tk.END, resultado_str)
-                resultados_actuales['titulo'] = 'Prueba de Hipótesis'
-                resultados_actuales['datos'] = resultado_str
 
-                canvas_grafico.draw()
+                def calcular():
+                    # Muestras N(μ₀, σ²), una fila por simulación, generadas por
+                    # bloques de filas sobre el mismo arreglo; de cada bloque solo
+                    # se conservan las medias. Los arreglos de la corrida anterior
+                    # se reutilizan si el tamaño coincide
+                    filas = max(1, min(sims, HIPOTESIS_BLOQUE // n))
+                    muestras = buffers['muestras']
+                    if muestras is None or muestras.shape != (filas, n):
+                        muestras = buffers['muestras'] = np.empty((filas, n))
+                    medias_muestra = buffers['medias']
+                    if medias_muestra is None or medias_muestra.size != sims:
+                        medias_muestra = buffers['medias'] = np.empty(sims)
+                    for inicio in range(0, sims, filas):
+                        fin = min(inicio + filas, sims)
+                        bloque = muestras[:fin - inicio]
+                        gen.normal(mu_0, sigma, n=bloque.size, out=bloque)
+                        bloque.mean(axis=1, out=medias_muestra[inicio:fin])
+
+                    # Test Z de todas las muestras: ¿rechazamos H0? Como la cola es
+                    # decreciente, 2·sf(|z|) < α equivale a |z| > z crítico, que se
+                    # calcula una sola vez en lugar de un valor p por muestra
+                    z_stats = (medias_muestra - mu_0) / se
+                    z_critico = _z_critico(alpha)
+                    rechazos = int(np.count_nonzero(np.abs(z_stats) > z_critico))
+                    # Media, mínimo y máximo salen de una sola pasada; el rango del
+                    # histograma se toma de ahí para que np.histogram no lo recorra otra vez
+                    resumen = estadisticas_basicas(medias_muestra)
+                    histograma = np.histogram(medias_muestra, bins=CLASES_MONTE_CARLO,
+                                              range=(resumen[3], resumen[4]), density=True)
+                    return (histograma, rechazos) + resumen
+
+                def mostrar(resultado):
+                    histograma, rechazos, media_medias, _, _, min_media, max_media = resultado
+
+                    preparar_ejes(conservar=barras_hist[0])
+                    dibujar_histograma(*histograma)
+
+                    x_range = np.linspace(min_media, max_media, 100)
+                    pdf = stats.norm.pdf(x_range, mu_0, se)
+                    ax.plot(x_range, pdf, 'r-', linewidth=2, label='N(μ₀, SE²)')
+                    ax.axvline(mu_0, color='green', linestyle='--', linewidth=2, label=f'μ₀ = {mu_0}')
+                    ax.set_xlabel('Media Muestral', color='#4b2e05', fontweight='bold')
+                    ax.set_ylabel('Densidad', color='#4b2e05', fontweight='bold')
+                    ax.set_title('Prueba de Hipótesis - Distribución de Medias Muestrales', color='#4b2e05', fontweight='bold')
+                    ax.legend(facecolor='#6b4423', edgecolor='#4b2e05', labelcolor='#4b2e05')
+
+                    potencia = rechazos / sims
+
+                    resultados_text.delete(1.0, tk.END)
+                    resultado_str = f"""PRUEBA DE HIPÓTESIS - MONTE CARLO
+{'='*33}
+
+H₀: μ = {mu_0}
+H₁: μ ≠ {mu_0}
+Nivel significancia: {alpha}
+
+Parámetros:
+- Desv. estándar:    {sigma}
+- Tamaño muestra:    {n}
+- Simulaciones:      {sims}
+
+Pasos de simulación:
+1. Generar {sims} muestras N({mu_0}, {sigma}²)
+2. Calcular media de cada muestra
+3. Realizar test Z para cada muestra
+4. Contar rechazos de H₀
+
+Resultados:
+Media de medias:     {media_medias:.4f}
+Error estándar:      {se:.4f}
+Rechazos H₀:         {rechazos}
+Potencia (tipo II):  {potencia:.4f}
+Min media:           {min_media:.4f}
+Max media:           {max_media:.4f}
+"""
+
+                    resultados_text.insert(tk.END, resultado_str)
+                    resultados_actuales['titulo'] = 'Prueba de Hipótesis'
+                    resultados_actuales['datos'] = resultado_str
+
+                    canvas_grafico.draw_idle()
+
+                en_segundo_plano(calcular, mostrar)
             except Exception as e:
                 messagebox.showerror("Error", f"Error en simulación: {str(e)}", parent=ventana)
 
@@ -2538,29 +3312,33 @@ Semilla usada:  {gen.semilla}"""
             
             if archivo:
                 try:
-                    # Exportar resultados en texto con UTF-8
+                    # Exportar resultados en texto con UTF-8, armados en memoria
+                    # y escritos con una sola llamada
+                    informe = f"""{'='*50}
+RESULTADOS - SIMULACIÓN MONTE CARLO
+{'='*50}
+
+Fecha: {time.strftime('%Y-%m-%d %H:%M:%S')}
+Problema: {resultados_actuales['titulo']}
+
+{resultados_actuales['datos']}
+
+{'='*50}
+Fin del reporte
+{'='*50}
+"""
                     with open(archivo, 'w', encoding='utf-8') as f:
-                        f.write("="*50 + "\n")
-                        f.write("RESULTADOS - SIMULACIÓN MONTE CARLO\n")
-                        f.write("="*50 + "\n\n")
-                        f.write(f"Fecha: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        f.write(f"Problema: {resultados_actuales['titulo']}\n\n")
-                        f.write(resultados_actuales['datos'])
-                        f.write("\n\n" + "="*50 + "\n")
-                        f.write("Fin del reporte\n")
-                        f.write("="*50 + "\n")
+                        f.write(informe)
                     
-                    # Exportar gráfico como imagen PNG
+                    # Exportar gráfico como imagen PNG en segundo plano
                     archivo_grafico = archivo.replace('.txt', '_grafico.png')
-                    fig.savefig(archivo_grafico, dpi=300, bbox_inches='tight', facecolor='#6b4423')
-                    
-                    messagebox.showinfo(
+                    self._guardar_grafico(ventana, fig, archivo_grafico, lambda: messagebox.showinfo(
                         "Éxito", 
                         f"Resultados exportados correctamente:\n\n"
                         f"Texto: {archivo}\n"
                         f"Gráfico: {archivo_grafico}",
                         parent=ventana
-                    )
+                    ))
                 except Exception as e:
                     messagebox.showerror("Error", f"Error al exportar: {str(e)}", parent=ventana)
 
@@ -2568,15 +3346,16 @@ Semilla usada:  {gen.semilla}"""
         botones_frame = tk.Frame(main_frame, bg='#b8945f')
         botones_frame.pack(fill="x", padx=10, pady=10)
 
-        tk.Button(botones_frame, text="Ejecutar Simulación", command=ejecutar_simulacion,
+        btn_ejecutar = tk.Button(botones_frame, text="Ejecutar Simulación", command=ejecutar_simulacion,
                 font=("Segoe UI", 10, "bold"), bg="#d4a574", fg="#4b2e05",
-                relief="flat", width=20, cursor='hand2').pack(side="left", padx=10)
+                relief="flat", width=20, cursor='hand2')
+        btn_ejecutar.pack(side="left", padx=10)
 
         tk.Button(botones_frame, text="Exportar Resultados", command=exportar_resultados,
                 font=("Segoe UI", 10, "bold"), bg="#4b2e05", fg="#f5deb3",
                 relief="flat", width=18, cursor='hand2').pack(side="left", padx=10)
 
-        tk.Button(botones_frame, text="Cerrar", command=on_close,
+        tk.Button(botones_frame, text="Cerrar", command=ventana.destroy,
                 font=("Segoe UI", 10, "bold"), bg="#e74c3c", fg="white",
                 relief="flat", width=12, cursor='hand2').pack(side="right", padx=10)
 
@@ -2611,28 +3390,9 @@ Semilla usada:  {gen.semilla}"""
         main_frame = tk.Frame(canvas, bg='#b8945f')
         main_frame_id = canvas.create_window((0, 0), window=main_frame, anchor="nw")
 
-        def actualizar_scroll(event=None):
-            """Actualiza el área scrolleable."""
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(main_frame_id, width=canvas.winfo_width())
-
-        main_frame.bind("<Configure>", actualizar_scroll)
-        canvas.bind("<Configure>", actualizar_scroll)
+        self._ajustar_scroll(canvas, main_frame, main_frame_id)
 
-        def scroll_con_mouse(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", scroll_con_mouse)
-        canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-        canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
-        
-        def on_close():
-            canvas.unbind_all("<MouseWheel>")
-            canvas.unbind_all("<Button-4>")
-            canvas.unbind_all("<Button-5>")
-            ventana.destroy()
-        
-        ventana.protocol("WM_DELETE_WINDOW", on_close)
+        self._vincular_rueda(ventana, canvas)
 
         # -------------------- Contenido de Ayuda --------------------
         def crear_seccion(titulo, contenido):
@@ -2647,8 +3407,10 @@ Semilla usada:  {gen.semilla}"""
                             justify="left", wraplength=900)
             label.pack(padx=15, pady=10, anchor="w")
 
+        secciones = []  # (título, contenido) de cada sección, en orden
+
         # ═══════════════════════════════════════════════════════════════════════════
-        crear_seccion(
+        secciones.append((
             "1. GENERACIÓN DE VARIABLES ALEATORIAS",
             """
     DESCRIPCIÓN:
@@ -2682,10 +3444,10 @@ Semilla usada:  {gen.semilla}"""
     Presione "Exportar Datos" para guardar los valores generados en 
     un archivo de texto para uso posterior.
             """
-        )
+        ))
 
         # ═══════════════════════════════════════════════════════════════════════════
-        crear_seccion(
+        secciones.append((
             "2. PRUEBA DE AJUSTE DE DISTRIBUCIONES",
             """
     DESCRIPCIÓN:
@@ -2728,10 +3490,10 @@ Semilla usada:  {gen.semilla}"""
     Presione "Exportar Resultados" para guardar el reporte completo 
     con todos los estadísticos y conclusiones.
             """
-        )
+        ))
 
         # ═══════════════════════════════════════════════════════════════════════════
-        crear_seccion(
+        secciones.append((
             "3. MÉTODO DE MONTE CARLO - 6 PROBLEMAS",
             """
     DESCRIPCIÓN:
@@ -2796,10 +3558,10 @@ Semilla usada:  {gen.semilla}"""
     • Panel de resultados con estadísticas detalladas
     • Pasos de simulación explicados en texto
             """
-        )
+        ))
 
         # ═══════════════════════════════════════════════════════════════════════════
-        crear_seccion(
+        secciones.append((
             "CONSEJOS Y BUENAS PRÁCTICAS",
             """
     VALIDACIÓN DE DATOS:
@@ -2827,10 +3589,10 @@ Semilla usada:  {gen.semilla}"""
     ⚠ Para pruebas: comience con valores pequeños
     ⚠ Aumente gradualmente para resultados finales
             """
-        )
+        ))
 
         # ═══════════════════════════════════════════════════════════════════════════
-        crear_seccion(
+        secciones.append((
             "SOLUCIÓN DE PROBLEMAS",
             """
     PROBLEMA: "Error al cargar archivo"
@@ -2861,13 +3623,38 @@ Semilla usada:  {gen.semilla}"""
     ¿Necesita más ayuda? Verifique que todos los datos sean válidos 
     y los parámetros sean razonables.
             """
-        )
+        ))
+
+        # La primera sección se construye de inmediato; las demás, que al abrir
+        # quedan fuera de la vista, se agregan de a una cuando Tk queda libre,
+        # así la ventana aparece sin esperar a medir todo el texto
+        crear_seccion(*secciones[0])
+
+        pendiente = [None]  # id del after_idle que construye la siguiente sección
+
+        def crear_pendientes(indice):
+            """Construye la sección `indice` y programa la siguiente."""
+            pendiente[0] = None
+            if indice == len(secciones) or not ventana.winfo_exists():
+                return
+            crear_seccion(*secciones[indice])
+            pendiente[0] = ventana.after_idle(crear_pendientes, indice + 1)
+
+        def cancelar_pendientes(event):
+            # Si la ventana se cierra antes de terminar, el callback quedaría
+            # apuntando a un comando de Tk ya eliminado
+            if event.widget is ventana and pendiente[0] is not None:
+                ventana.after_cancel(pendiente[0])
+                pendiente[0] = None
+
+        pendiente[0] = ventana.after_idle(crear_pendientes, 1)
+        ventana.bind("<Destroy>", cancelar_pendientes, add="+")
 
         # -------------------- Botón Cerrar --------------------
         botones_frame = tk.Frame(ventana, bg='#fcdea6')
         botones_frame.pack(fill="x", padx=15, pady=10)
         
-        tk.Button(botones_frame, text="Cerrar Ayuda", command=on_close,
+        tk.Button(botones_frame, text="Cerrar Ayuda", command=ventana.destroy,
                 font=("Segoe UI", 11, "bold"), bg="#e74c3c", fg="white",
                 relief="flat", width=20, height=2, cursor='hand2').pack(side="right")
 